@@ -0,0 +1,249 @@
+import math
+import mmap
+import struct
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from .LedMatrix import MATRIX_HEIGHT, MATRIX_LED_COUNT, MATRIX_WIDTH, LedMatrix
+
+# File layout: header, then one record per frame.
+#   Header: magic, version, encoding, 2 reserved bytes, fps (float32),
+#           frame count (uint32)
+#   ENCODING_RAW:   every frame is 192 bytes RGB in strip order
+#   ENCODING_DELTA: uint8 n, then n * (index, r, g, b) changed pixels, or
+#                   n = KEYFRAME followed by 192 bytes RGB
+ANIMATION_MAGIC: bytes = b"JPLA"
+ANIMATION_VERSION: int = 1
+ENCODING_RAW: int = 0
+ENCODING_DELTA: int = 1
+KEYFRAME: int = 0xFF
+
+_HEADER = struct.Struct("<4sBB2xfI")
+_FRAME_SIZE = MATRIX_LED_COUNT * 3
+_DELTA_LIMIT = (_FRAME_SIZE - 1) // 4  # Above this a keyframe is smaller
+
+
+def writeAnimation(path: str, frames: Iterable, fps: float, delta: bool = True) -> int:
+    """Write frames to an animation file.
+
+    Frames are written as they are produced, so any generator can be
+    captured without keeping it in memory.
+
+    Args:
+        path: File path to write.
+        frames: Iterable of frames of shape (8, 8, 3) or (64, 3).
+        fps: Playback rate in frames per second.
+        delta: Store only changed pixels per frame (default True).
+
+    Returns:
+        Number of frames written.
+
+    Raises:
+        ValueError: If fps is not positive or a frame has the wrong shape.
+    """
+    if not (math.isfinite(fps) and fps > 0):
+        raise ValueError("FPS must be positive")
+
+    encoding = ENCODING_DELTA if delta else ENCODING_RAW
+    previous = np.zeros((MATRIX_LED_COUNT, 3), dtype=np.uint8)
+    count = 0
+
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(ANIMATION_MAGIC, ANIMATION_VERSION, encoding, fps, 0))
+
+        for frame in frames:
+            pixels = (
+                LedMatrix._validateFrame(frame)
+                .astype(np.uint8, copy=False)
+                .reshape(MATRIX_LED_COUNT, 3)
+            )
+            if not delta:
+                file.write(pixels.tobytes())
+            else:
+                changed = np.flatnonzero((pixels != previous).any(axis=1))
+                if len(changed) > _DELTA_LIMIT:
+                    file.write(bytes((KEYFRAME,)))
+                    file.write(pixels.tobytes())
+                else:
+                    records = np.empty((len(changed), 4), dtype=np.uint8)
+                    records[:, 0] = changed
+                    records[:, 1:] = pixels[changed]
+                    file.write(bytes((len(changed),)))
+                    file.write(records.tobytes())
+                previous[:] = pixels
+            count += 1
+
+        # Patch the frame count now that it is known
+        file.seek(0)
+        file.write(
+            _HEADER.pack(ANIMATION_MAGIC, ANIMATION_VERSION, encoding, fps, count)
+        )
+
+    return count
+
+
+class LedAnimation:
+    """Animation file opened for playback via a memory map.
+
+    Frames are read straight from the mapped file, so long animations do
+    not occupy Python memory and need no rendering at playback time.
+
+    Attributes:
+        fps: Playback rate in frames per second.
+        frameCount: Number of frames in the file.
+        encoding: ENCODING_RAW or ENCODING_DELTA.
+    """
+
+    __slots__ = ("fps", "frameCount", "encoding", "_file", "_map")
+
+    def __init__(self, path: str):
+        """Open an animation file.
+
+        Args:
+            path: Path of a file written by writeAnimation().
+
+        Raises:
+            ValueError: If the file is not a valid animation file.
+        """
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("Not an animation file") from None
+
+        try:
+            magic, version, encoding, fps, count = _HEADER.unpack_from(self._map)
+        except struct.error:
+            magic = None
+        if magic != ANIMATION_MAGIC or version != ANIMATION_VERSION:
+            self.close()
+            raise ValueError("Not an animation file")
+        if encoding not in (ENCODING_RAW, ENCODING_DELTA):
+            self.close()
+            raise ValueError("Unknown animation encoding")
+        if not (math.isfinite(fps) and fps > 0):
+            self.close()
+            raise ValueError("Invalid animation frame rate")
+
+        self.fps = fps
+        self.frameCount = count
+        self.encoding = encoding
+
+    def __len__(self) -> int:
+        return self.frameCount
+
+    def __enter__(self) -> "LedAnimation":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def asArray(self) -> np.ndarray:
+        """Get all frames of a raw file as a zero-copy array.
+
+        The array keeps the memory map alive, it stays valid after close().
+
+        Returns:
+            Read-only (frames, 8, 8, 3) uint8 array backed by the file.
+
+        Raises:
+            ValueError: If the file is delta encoded or truncated.
+        """
+        if self.encoding != ENCODING_RAW:
+            raise ValueError("Only raw animation files can be mapped as array")
+        if len(self._map) < _HEADER.size + self.frameCount * _FRAME_SIZE:
+            raise ValueError("Animation file is truncated")
+        frames = np.frombuffer(
+            self._map,
+            dtype=np.uint8,
+            count=self.frameCount * _FRAME_SIZE,
+            offset=_HEADER.size,
+        )
+        return frames.reshape(self.frameCount, MATRIX_HEIGHT, MATRIX_WIDTH, 3)
+
+    def frames(self, loops: int = 1) -> Iterator[np.ndarray]:
+        """Iterate over the frames of the file.
+
+        Delta files are decoded into one reused buffer, copy a frame if it
+        is needed after the next one was requested.
+
+        Args:
+            loops: Number of repetitions, 0 for infinite (default 1).
+
+        Yields:
+            One (8, 8, 3) uint8 frame at a time.
+
+        Raises:
+            ValueError: If the file is truncated or has an invalid record.
+        """
+        if self.encoding == ENCODING_RAW:
+            yield from LedMatrix._loopFrames(self.asArray(), loops)
+            return
+
+        data = self._map
+        size = len(data)
+        current = np.zeros((MATRIX_LED_COUNT, 3), dtype=np.uint8)
+        frame = current.reshape(MATRIX_HEIGHT, MATRIX_WIDTH, 3)
+        loopCount = 0
+
+        while self.frameCount and (loops == 0 or loopCount < loops):
+            current.fill(0)
+            position = _HEADER.size
+            for _ in range(self.frameCount):
+                if position >= size:
+                    raise ValueError("Animation file is truncated")
+                count = data[position]
+                position += 1
+                if count != KEYFRAME and count > _DELTA_LIMIT:
+                    raise ValueError("Invalid delta record")
+                length = _FRAME_SIZE if count == KEYFRAME else count * 4
+                if position + length > size:
+                    raise ValueError("Animation file is truncated")
+                if count == KEYFRAME:
+                    current[:] = np.frombuffer(
+                        data, np.uint8, _FRAME_SIZE, position
+                    ).reshape(MATRIX_LED_COUNT, 3)
+                    position += _FRAME_SIZE
+                elif count:
+                    records = np.frombuffer(data, np.uint8, count * 4, position)
+                    records = records.reshape(count, 4)
+                    if records[:, 0].max() >= MATRIX_LED_COUNT:
+                        raise ValueError("Invalid delta record")
+                    current[records[:, 0]] = records[:, 1:]
+                    position += count * 4
+                yield frame
+            loopCount += 1
+
+    def play(self, led: LedMatrix, loops: int = 1) -> None:
+        """Play the animation on an LedMatrix in the background.
+
+        A delta file must stay open until playback is finished or stopped
+        with led.stopAnimation(); raw files may be closed right away.
+
+        Args:
+            led: LedMatrix to play on.
+            loops: Number of repetitions, 0 for infinite (default 1).
+        """
+        delay = 1.0 / self.fps
+        if self.encoding == ENCODING_RAW:
+            led.play(self.asArray(), delay, loops)
+        else:
+            led.play(self.frames(loops), delay)
+
+    def close(self) -> None:
+        """Close the memory map and the file.
+
+        While arrays from asArray() (e.g. a running raw play()) still use
+        the map, it is only released, and unmapped once they are gone.
+        """
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass  # Exported arrays hold a reference and keep it mapped
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
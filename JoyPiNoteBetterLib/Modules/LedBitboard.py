@@ -0,0 +1,197 @@
+from typing import Iterator, Optional, Sequence, Tuple
+
+from .LedMatrix import FULL_MASK, ColorTuple, LedMatrix
+
+# Bitboards are 64-bit masks in the layout of FONT_MASKS and showMask():
+# bit (y << 3) + x is the cell at x, y. Shift by 1 moves a column, by 8 a row.
+COLUMN_0: int = 0x0101010101010101  # Left column
+COLUMN_7: int = COLUMN_0 << 7  # Right column
+ROW_0: int = 0xFF  # Top row
+ROW_7: int = ROW_0 << 56  # Bottom row
+BORDER: int = COLUMN_0 | COLUMN_7 | ROW_0 | ROW_7
+
+_NOT_COLUMN_0 = FULL_MASK ^ COLUMN_0
+_NOT_COLUMN_7 = FULL_MASK ^ COLUMN_7
+
+
+def cellBit(x: int, y: int) -> int:
+    """Get the bitboard with only the cell at x, y set.
+
+    Args:
+        x: Column (0-7).
+        y: Row (0-7).
+
+    Returns:
+        Single-cell bitboard.
+
+    Raises:
+        ValueError: If the position is outside the matrix.
+    """
+    if not (0 <= x < 8 and 0 <= y < 8):
+        raise ValueError("Position out of range")
+    return 1 << ((y << 3) + x)
+
+
+def cellsOf(board: int) -> Iterator[Tuple[int, int]]:
+    """Iterate over the set cells of a bitboard.
+
+    Args:
+        board: Bitboard.
+
+    Yields:
+        (x, y) of every set cell, in strip order.
+    """
+    while board:
+        lowest = board & -board
+        index = lowest.bit_length() - 1
+        yield index & 7, index >> 3
+        board ^= lowest
+
+
+def countCells(board: int) -> int:
+    """Count the set cells of a bitboard.
+
+    Args:
+        board: Bitboard.
+
+    Returns:
+        Number of set cells (0-64).
+    """
+    return bin(board & FULL_MASK).count("1")
+
+
+def neighbors(board: int, diagonal: bool = False) -> int:
+    """Get all cells next to the set cells of a bitboard.
+
+    Moves do not wrap around the edges. The set cells themselves are only
+    included if they are next to another set cell.
+
+    Args:
+        board: Bitboard.
+        diagonal: Include the diagonal neighbors (default False).
+
+    Returns:
+        Bitboard of the neighboring cells.
+    """
+    left = (board >> 1) & _NOT_COLUMN_7
+    right = (board << 1) & _NOT_COLUMN_0
+    if diagonal:
+        row = board | left | right
+        return ((row << 8) | (row >> 8) | left | right) & FULL_MASK
+    return ((board << 8) | (board >> 8) | left | right) & FULL_MASK
+
+
+# 4-neighborhood of every single cell, indexed by (y << 3) + x
+NEIGHBOR_MASKS: Tuple[int, ...] = tuple(neighbors(1 << i) for i in range(64))
+
+
+def _grow(board: int, passable: int, diagonal: bool) -> int:
+    """Extend a region by one step into passable cells."""
+    if diagonal:
+        return (board | neighbors(board, True)) & passable
+    return (
+        board
+        | (board << 8)
+        | (board >> 8)
+        | ((board >> 1) & _NOT_COLUMN_7)
+        | ((board << 1) & _NOT_COLUMN_0)
+    ) & passable
+
+
+def floodFill(seeds: int, passable: int, diagonal: bool = False) -> int:
+    """Get all cells reachable from the seeds through passable cells.
+
+    The region grows by one step per iteration for all cells at once, so
+    the cost depends on the path length, not on the number of cells.
+
+    Args:
+        seeds: Bitboard of start cells (only passable ones are used).
+        passable: Bitboard of cells that can be entered.
+        diagonal: Allow diagonal steps (default False).
+
+    Returns:
+        Bitboard of the reachable region.
+    """
+    filled = seeds & passable
+    while True:
+        grown = _grow(filled, passable, diagonal)
+        if grown == filled:
+            return filled
+        filled = grown
+
+
+def pathLength(
+    start: int, end: int, passable: int, diagonal: bool = False
+) -> Optional[int]:
+    """Get the number of steps of the shortest path between two cell sets.
+
+    Args:
+        start: Bitboard of start cells.
+        end: Bitboard of goal cells; reaching any of them ends the search.
+        passable: Bitboard of cells that can be entered (should include
+            start and end).
+        diagonal: Allow diagonal steps (default False).
+
+    Returns:
+        Steps of the shortest path, or None if no goal can be reached.
+    """
+    filled = start & passable
+    steps = 0
+    while not filled & end:
+        grown = _grow(filled, passable, diagonal)
+        if grown == filled:
+            return None
+        filled = grown
+        steps += 1
+    return steps
+
+
+def hasPath(start: int, end: int, passable: int, diagonal: bool = False) -> bool:
+    """Check if a goal can be reached from the start through passable cells.
+
+    Args:
+        start: Bitboard of start cells.
+        end: Bitboard of goal cells.
+        passable: Bitboard of cells that can be entered (should include
+            start and end).
+        diagonal: Allow diagonal steps (default False).
+
+    Returns:
+        True if any goal cell is reachable.
+    """
+    return pathLength(start, end, passable, diagonal) is not None
+
+
+def squares(board: int) -> int:
+    """Find the 2x2 blocks whose cells are all set.
+
+    Args:
+        board: Bitboard.
+
+    Returns:
+        Bitboard of the top left cell of every full 2x2 block.
+    """
+    pairs = board & (board >> 1) & _NOT_COLUMN_7  # Cell and its right neighbor
+    return pairs & (pairs >> 8)
+
+
+def renderBoards(
+    led: LedMatrix,
+    layers: Sequence[Tuple[int, ColorTuple]],
+    background: ColorTuple = (0, 0, 0),
+) -> None:
+    """Draw colored bitboards on the matrix and update it.
+
+    Later layers are drawn on top of earlier ones. For a single board,
+    LedMatrix.showMask() does the same.
+
+    Args:
+        led: LedMatrix to draw on.
+        layers: Sequence of (board, color) pairs.
+        background: Color of cells not set in any board (default (0, 0, 0)).
+    """
+    pixels = led.frame.reshape(64, 3)
+    pixels[:] = LedMatrix._validateColor(background)
+    for board, color in layers:
+        pixels[LedMatrix._maskToBits(board)] = LedMatrix._validateColor(color)
+    led.update()
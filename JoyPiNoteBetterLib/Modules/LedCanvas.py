@@ -0,0 +1,335 @@
+import threading
+from typing import Optional, Tuple, Union
+
+import numpy as np
+from rpi_ws281x import PixelStrip
+
+from .LedMatrix import (
+    DEFAULT_BRIGHTNESS,
+    IDENTITY_TRANSFORM,
+    MATRIX_CHANNEL,
+    MATRIX_DMA,
+    MATRIX_FREQ_HZ,
+    MATRIX_HEIGHT,
+    MATRIX_LED_COUNT,
+    MATRIX_PIN,
+    MATRIX_WIDTH,
+    ColorTuple,
+    LedMatrix,
+    _StripWriter,
+)
+
+# Order in which the panels are chained on the data line
+LAYOUT_TILES: str = "tiles"  # Every panel row runs left to right
+LAYOUT_SERPENTINE: str = "serpentine"  # Panel rows alternate direction
+
+
+def canvasIndexMap(
+    tilesX: int,
+    tilesY: int = 1,
+    layout: str = LAYOUT_TILES,
+    tileTransform: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Build the map from strip position to display pixel for chained panels.
+
+    Entry i is the row-major pixel index (y * width + x) of the display
+    that LED i of the chain shows, so a whole frame is reordered with one
+    gather, the same way as the transforms of LedMatrix.
+
+    Args:
+        tilesX: Number of panels per row.
+        tilesY: Number of panel rows (default 1).
+        layout: LAYOUT_TILES or LAYOUT_SERPENTINE (default LAYOUT_TILES).
+        tileTransform: 64-entry transform applied inside every panel, e.g.
+            rotateTransform() for the mounting orientation (default None).
+
+    Returns:
+        Read-only array of tilesX * tilesY * 64 display pixel indices.
+
+    Raises:
+        ValueError: If the tile counts, layout or transform are invalid.
+    """
+    if tilesX < 1 or tilesY < 1:
+        raise ValueError("Tile counts must be at least 1")
+    if layout not in (LAYOUT_TILES, LAYOUT_SERPENTINE):
+        raise ValueError("Unknown layout")
+    local = IDENTITY_TRANSFORM
+    if tileTransform is not None:
+        local = np.asarray(tileTransform, dtype=np.intp)
+        if local.shape != (MATRIX_LED_COUNT,):
+            raise ValueError("Transform must have 64 entries")
+
+    # Panel position of every chain slot
+    tileY, tileX = np.divmod(np.arange(tilesX * tilesY), tilesX)
+    if layout == LAYOUT_SERPENTINE:
+        tileX = np.where(tileY & 1, tilesX - 1 - tileX, tileX)
+
+    # Display coordinates of every LED: (panels, 64)
+    localY, localX = np.divmod(local, MATRIX_WIDTH)
+    y = tileY[:, None] * MATRIX_HEIGHT + localY
+    x = tileX[:, None] * MATRIX_WIDTH + localX
+    indexMap = (y * (tilesX * MATRIX_WIDTH) + x).reshape(-1)
+    indexMap.setflags(write=False)
+    return indexMap
+
+
+class LedCanvas:
+    """Virtual canvas shown on several chained 8x8 LED matrices.
+
+    The canvas can be larger than the display; the display shows a
+    viewport of it that wraps around at the edges. The map from canvas to
+    strip is recomputed only when the viewport moves, so every update()
+    is one gather over all pixels and a single show() for the whole chain.
+
+    Attributes:
+        matrix: The underlying PixelStrip instance.
+        frame: Canvas as (height, width, 3) uint8 array, indexed [y, x, channel].
+        displayWidth: Width of the chained display in pixels.
+        displayHeight: Height of the chained display in pixels.
+    """
+
+    __slots__ = (
+        "matrix",
+        "frame",
+        "displayWidth",
+        "displayHeight",
+        "_pixels",
+        "_indexMap",
+        "_viewport",
+        "_gather",
+        "_output",
+        "_writer",
+        "_led",
+        "_forceShow",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        tilesX: int,
+        tilesY: int = 1,
+        layout: str = LAYOUT_TILES,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        tileTransform: Optional[np.ndarray] = None,
+        brightness: int = DEFAULT_BRIGHTNESS,
+        strip: Optional[Union[PixelStrip, LedMatrix]] = None,
+    ):
+        """Initialize the chained matrices.
+
+        Args:
+            tilesX: Number of panels per row.
+            tilesY: Number of panel rows (default 1).
+            layout: Panel chaining, LAYOUT_TILES or LAYOUT_SERPENTINE
+                (default LAYOUT_TILES).
+            width: Canvas width in pixels, at least the display width
+                (default display width).
+            height: Canvas height in pixels, at least the display height
+                (default display height).
+            tileTransform: 64-entry transform applied inside every panel
+                (default None).
+            brightness: Initial brightness level (0-255, default 100).
+            strip: Initialized PixelStrip to draw on instead of creating
+                one, or an LedMatrix to share its strip with. Pass the
+                LedMatrix itself rather than LedMatrix.matrix, so both know
+                what the other wrote (default None).
+
+        Raises:
+            ValueError: If the layout, canvas size or strip length is invalid.
+        """
+        self._indexMap = canvasIndexMap(tilesX, tilesY, layout, tileTransform)
+        self.displayWidth = tilesX * MATRIX_WIDTH
+        self.displayHeight = tilesY * MATRIX_HEIGHT
+        width = self.displayWidth if width is None else width
+        height = self.displayHeight if height is None else height
+        if width < self.displayWidth or height < self.displayHeight:
+            raise ValueError("Canvas must be at least as large as the display")
+
+        ledCount = len(self._indexMap)
+        self._led: Optional[LedMatrix] = None
+        if isinstance(strip, LedMatrix):
+            if ledCount != MATRIX_LED_COUNT:
+                raise ValueError("Strip is too short for the panels")
+            self._led = strip
+            strip = strip.matrix
+        elif strip is None:
+            LedMatrix._checkPermissions()
+            strip = PixelStrip(
+                ledCount,
+                MATRIX_PIN,
+                MATRIX_FREQ_HZ,
+                MATRIX_DMA,
+                False,  # Signal inversion
+                brightness,
+                MATRIX_CHANNEL,
+            )
+            strip.begin()
+        elif strip.numPixels() < ledCount:
+            raise ValueError("Strip is too short for the panels")
+        self.matrix = strip
+
+        self.frame = np.zeros((height, width, 3), dtype=np.uint8)
+        self._pixels = self.frame.reshape(-1, 3)
+        self._output = np.zeros((ledCount, 3), dtype=np.uint8)
+        self._forceShow = True
+
+        if self._led is not None:
+            # Same strip buffer and lock as the LedMatrix
+            self._writer = self._led._writer
+            self._lock = self._led._lock
+        else:
+            self._writer = _StripWriter(strip, ledCount)
+            self._lock = threading.Lock()
+
+        self._viewport = (0, 0)
+        self._gather = self._buildGather(0, 0)
+
+    def _buildGather(self, x: int, y: int) -> np.ndarray:
+        """Build the canvas pixel index of every LED for a viewport.
+
+        Args:
+            x: Left canvas column of the viewport.
+            y: Top canvas row of the viewport.
+
+        Returns:
+            Array of canvas pixel indices in strip order.
+        """
+        height, width = self.frame.shape[:2]
+        displayY, displayX = np.divmod(self._indexMap, self.displayWidth)
+        return ((displayY + y) % height) * width + (displayX + x) % width
+
+    def setViewport(self, x: int, y: int = 0) -> None:
+        """Move the visible part of the canvas.
+
+        Coordinates wrap around, so scrolling past the edge continues at the
+        other side.
+
+        Args:
+            x: Left canvas column shown on the display.
+            y: Top canvas row shown on the display (default 0).
+        """
+        height, width = self.frame.shape[:2]
+        viewport = (x % width, y % height)
+        if viewport != self._viewport:
+            self._viewport = viewport
+            self._gather = self._buildGather(*viewport)
+
+    def scrollViewport(self, dx: int, dy: int = 0) -> None:
+        """Move the viewport relative to its current position.
+
+        Args:
+            dx: Columns to move right (negative moves left).
+            dy: Rows to move down (negative moves up) (default 0).
+        """
+        x, y = self._viewport
+        self.setViewport(x + dx, y + dy)
+
+    def getViewport(self) -> Tuple[int, int]:
+        """Get the canvas position shown at the top left of the display.
+
+        Returns:
+            Tuple of (x, y).
+        """
+        return self._viewport
+
+    def clear(self) -> None:
+        """Turn off all pixels of the canvas and update the display."""
+        self.frame.fill(0)
+        self.update()
+
+    def setPixel(self, x: int, y: int, color: ColorTuple) -> None:
+        """Set a single canvas pixel to the specified color.
+
+        Args:
+            x: Canvas column.
+            y: Canvas row.
+            color: RGB color tuple (R, G, B).
+
+        Raises:
+            ValueError: If the position is outside the canvas.
+        """
+        height, width = self.frame.shape[:2]
+        if not (0 <= x < width and 0 <= y < height):
+            raise ValueError("Position out of range")
+        self.frame[y, x] = LedMatrix._validateColor(color)
+
+    def setAll(self, color: ColorTuple) -> None:
+        """Set all canvas pixels to the same color.
+
+        Args:
+            color: RGB color tuple (R, G, B).
+        """
+        self.frame[:] = LedMatrix._validateColor(color)
+
+    def setBrightness(self, brightness: int) -> None:
+        """Set the brightness of all chained matrices.
+
+        Args:
+            brightness: Brightness level (0-255).
+
+        Raises:
+            ValueError: If brightness is out of range.
+        """
+        if not 0 <= brightness <= 255:
+            raise ValueError("Brightness out of range")
+        self.matrix.setBrightness(brightness)
+        self._forceShow = True
+
+    def drawText(
+        self,
+        text: str,
+        color: ColorTuple,
+        x: int = 0,
+        y: int = 0,
+        background: Optional[ColorTuple] = None,
+    ) -> int:
+        """Draw text into the canvas, clipped at its edges.
+
+        Args:
+            text: Text to draw.
+            color: Text color as (R, G, B) tuple.
+            x: Canvas column of the first text column (default 0).
+            y: Canvas row of the top text row (default 0).
+            background: Color of unlit text pixels, None keeps the canvas
+                (default None).
+
+        Returns:
+            Width of the text in pixels.
+        """
+        color = LedMatrix._validateColor(color)
+        lit = LedMatrix._bitmapToMask(LedMatrix._textToBitmap(text))  # (8, columns)
+        textWidth = lit.shape[1]
+
+        # Clip the text block to the canvas
+        height, width = self.frame.shape[:2]
+        left, top = max(x, 0), max(y, 0)
+        right = min(x + textWidth, width)
+        bottom = min(y + MATRIX_HEIGHT, height)
+        if left >= right or top >= bottom:
+            return textWidth
+
+        region = self.frame[top:bottom, left:right]
+        lit = lit[top - y : bottom - y, left - x : right - x]
+        if background is not None:
+            region[:] = LedMatrix._validateColor(background)
+        region[lit] = color
+        return textWidth
+
+    def update(self, force: bool = False) -> None:
+        """Push the viewport of the canvas to all chained matrices.
+
+        Only LEDs whose value changed are passed to the strip, and the
+        transfer is skipped if nothing changed. On a strip shared with an
+        LedMatrix, its next update() pushes its own frame again.
+
+        Args:
+            force: Push the frame even if it did not change (default False).
+        """
+        with self._lock:
+            np.take(self._pixels, self._gather, axis=0, out=self._output)
+            if not self._writer.write(self._output, force or self._forceShow):
+                return
+            self._forceShow = False
+            if self._led is not None:
+                self._led._forceShow = True
+            self.matrix.show()
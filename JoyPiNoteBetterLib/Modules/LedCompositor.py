@@ -0,0 +1,155 @@
+from typing import Tuple
+
+import numpy as np
+
+from .LedMatrix import MATRIX_HEIGHT, MATRIX_LED_COUNT, MATRIX_WIDTH, LedMatrix
+
+# Type alias for RGBA color tuples
+RgbaTuple = Tuple[int, int, int, int]
+
+
+class LedCompositor:
+    """Stack of RGBA layers that is alpha-blended onto an LedMatrix.
+
+    Layer 0 is the bottom layer. All layers live in one (layers, 8, 8, 4)
+    uint8 array and are blended in a single vectorized pass. The blend is
+    only recomputed when a layer was changed since the last update().
+
+    Attributes:
+        led: The LedMatrix the composed frame is shown on.
+        layers: Layer stack as (layers, 8, 8, 4) uint8 array, indexed
+            [layer, y, x, channel]. Call markDirty() after writing to it.
+    """
+
+    __slots__ = ("led", "layers", "_dirty", "_composed")
+
+    def __init__(self, led: LedMatrix, layerCount: int = 2):
+        """Initialize the compositor with transparent layers.
+
+        Args:
+            led: LedMatrix to show the composed frames on.
+            layerCount: Number of layers (default 2).
+
+        Raises:
+            ValueError: If layerCount is less than 1.
+        """
+        if layerCount < 1:
+            raise ValueError("At least one layer is required")
+
+        self.led = led
+        self.layers = np.zeros(
+            (layerCount, MATRIX_HEIGHT, MATRIX_WIDTH, 4), dtype=np.uint8
+        )
+        self._dirty = True
+        self._composed = np.zeros((MATRIX_HEIGHT, MATRIX_WIDTH, 3), dtype=np.uint8)
+
+    @staticmethod
+    def _validateRgba(color: RgbaTuple) -> RgbaTuple:
+        """Validate that the color is a valid RGBA tuple.
+
+        Args:
+            color: RGBA color tuple to validate.
+
+        Returns:
+            The validated color tuple.
+
+        Raises:
+            ValueError: If color is not a 4-element tuple.
+        """
+        if len(color) != 4:
+            raise ValueError("Color must be (R, G, B, A) tuple")
+        return color
+
+    def getLayer(self, index: int) -> np.ndarray:
+        """Get a writable (8, 8, 4) view of a layer.
+
+        Call markDirty() after drawing into the view.
+
+        Args:
+            index: Layer index (0 = bottom).
+
+        Returns:
+            The layer as (8, 8, 4) uint8 array view.
+        """
+        return self.layers[index]
+
+    def markDirty(self) -> None:
+        """Mark the layers as changed so the next update() recomposes."""
+        self._dirty = True
+
+    def setLayer(self, index: int, rgba) -> None:
+        """Replace the content of a layer.
+
+        Args:
+            index: Layer index (0 = bottom).
+            rgba: Array-like of shape (8, 8, 4) or (64, 4).
+
+        Raises:
+            ValueError: If the layer data has the wrong shape.
+        """
+        rgba = np.asarray(rgba)
+        if rgba.shape == (MATRIX_LED_COUNT, 4):
+            rgba = rgba.reshape(MATRIX_HEIGHT, MATRIX_WIDTH, 4)
+        elif rgba.shape != (MATRIX_HEIGHT, MATRIX_WIDTH, 4):
+            raise ValueError("Layer must have shape (8, 8, 4) or (64, 4)")
+        self.layers[index] = rgba
+        self._dirty = True
+
+    def fillLayer(self, index: int, color: RgbaTuple) -> None:
+        """Fill a whole layer with one color.
+
+        Args:
+            index: Layer index (0 = bottom).
+            color: RGBA color tuple (R, G, B, A).
+        """
+        self.layers[index] = self._validateRgba(color)
+        self._dirty = True
+
+    def clearLayer(self, index: int) -> None:
+        """Make a layer fully transparent.
+
+        Args:
+            index: Layer index (0 = bottom).
+        """
+        self.layers[index] = 0
+        self._dirty = True
+
+    def setPixel(self, index: int, position: int, color: RgbaTuple) -> None:
+        """Set a single pixel of a layer.
+
+        Args:
+            index: Layer index (0 = bottom).
+            position: LED index (0-63).
+            color: RGBA color tuple (R, G, B, A).
+
+        Raises:
+            ValueError: If position is out of range.
+        """
+        if not 0 <= position < MATRIX_LED_COUNT:
+            raise ValueError("Position out of range")
+        self.layers[index, position >> 3, position & 7] = self._validateRgba(color)
+        self._dirty = True
+
+    def compose(self) -> np.ndarray:
+        """Blend all layers bottom to top over black.
+
+        Each layer covers what is below it by its alpha, so the weight of a
+        layer is its own alpha times the transparency of all layers above.
+
+        Returns:
+            The composed frame as (8, 8, 3) uint8 array.
+        """
+        if self._dirty:
+            alpha = self.layers[..., 3:].astype(np.float32) / 255.0
+            # Transparency of everything above each layer (1 for the top one)
+            above = np.ones_like(alpha)
+            above[:-1] = np.cumprod((1.0 - alpha)[:0:-1], axis=0)[::-1]
+            rgb = (self.layers[..., :3] * (alpha * above)).sum(axis=0)
+            np.rint(rgb, out=rgb)
+            self._composed[:] = rgb
+            self._dirty = False
+        return self._composed
+
+    def update(self) -> None:
+        """Compose the layers if they changed and show the result."""
+        self.led.showFrame(self.compose())
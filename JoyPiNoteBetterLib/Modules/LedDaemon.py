@@ -0,0 +1,414 @@
+import argparse
+import os
+import selectors
+import socket
+import struct
+import threading
+import time
+from typing import Dict, Optional
+
+import numpy as np
+
+from .LedMatrix import (
+    DEFAULT_BRIGHTNESS,
+    MATRIX_HEIGHT,
+    MATRIX_LED_COUNT,
+    MATRIX_WIDTH,
+    ColorTuple,
+    LedMatrix,
+    _renderScrollFrames,
+    shiftMask,
+)
+
+# Default Unix socket of the daemon
+DAEMON_SOCKET_PATH: str = "/tmp/joypi_ledmatrix.sock"
+DAEMON_FPS: float = 60.0  # Display refresh rate of the daemon
+
+# Message layout: command (uint8), payload length (uint16), payload
+COMMAND_FRAME: int = 0x01  # 192 bytes RGB in strip order
+COMMAND_CLEAR: int = 0x02  # no payload
+COMMAND_BRIGHTNESS: int = 0x03  # uint8 brightness
+COMMAND_GAMMA: int = 0x04  # float32 gamma
+COMMAND_FADE: int = 0x05  # float32 fade level
+
+_HEADER = struct.Struct("<BH")
+_FLOAT = struct.Struct("<f")
+_FRAME_SIZE = MATRIX_LED_COUNT * 3
+
+
+class LedDaemon:
+    """Long-running owner of the LedMatrix that draws frames sent by clients.
+
+    Clients connect to a Unix socket and send frames and commands (see
+    LedMatrixClient). Incoming frames only replace the framebuffer; the
+    matrix is updated once per refresh period, so any number of frames per
+    period costs a single transfer.
+
+    Attributes:
+        led: The LedMatrix owned by the daemon.
+        path: Path of the Unix socket.
+        fps: Display refresh rate.
+    """
+
+    __slots__ = ("led", "path", "fps", "_buffers")
+
+    def __init__(
+        self,
+        led: Optional[LedMatrix] = None,
+        path: str = DAEMON_SOCKET_PATH,
+        fps: float = DAEMON_FPS,
+    ):
+        """Initialize the daemon.
+
+        Args:
+            led: LedMatrix to draw on, or None to create one.
+            path: Path of the Unix socket (default "/tmp/joypi_ledmatrix.sock").
+            fps: Display refresh rate (default 60).
+        """
+        self.led = led if led is not None else LedMatrix()
+        self.path = path
+        self.fps = fps
+        self._buffers: Dict[socket.socket, bytearray] = {}
+
+    def _handle(self, command: int, payload: memoryview) -> None:
+        """Apply a single client message.
+
+        Args:
+            command: Command byte.
+            payload: Message payload.
+
+        Raises:
+            ValueError: If the message is invalid.
+        """
+        led = self.led
+        if command == COMMAND_FRAME and len(payload) == _FRAME_SIZE:
+            led.frame[:] = np.frombuffer(payload, np.uint8).reshape(led.frame.shape)
+        elif command == COMMAND_CLEAR:
+            led.frame.fill(0)
+        elif command == COMMAND_BRIGHTNESS and len(payload) == 1:
+            led.setBrightness(payload[0])
+        elif command == COMMAND_GAMMA and len(payload) == _FLOAT.size:
+            led.setGamma(_FLOAT.unpack(payload)[0])
+        elif command == COMMAND_FADE and len(payload) == _FLOAT.size:
+            led.setFadeLevel(_FLOAT.unpack(payload)[0])
+        else:
+            raise ValueError("Invalid message")
+
+    def _receive(self, selector: selectors.BaseSelector, conn: socket.socket) -> None:
+        """Read from a client and apply all complete messages.
+
+        Args:
+            selector: Selector the connection is registered with.
+            conn: Client connection.
+        """
+        buffer = self._buffers[conn]
+        try:
+            data = conn.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return  # Nothing read yet, the selector reports the client again
+        except ConnectionError:
+            data = b""  # Reset or broken pipe: same as a closed connection
+
+        buffer += data
+        view = memoryview(buffer)
+        offset = 0
+        try:
+            while len(view) - offset >= _HEADER.size:
+                command, length = _HEADER.unpack_from(view, offset)
+                end = offset + _HEADER.size + length
+                if len(view) < end:
+                    break
+                self._handle(command, view[offset + _HEADER.size : end])
+                offset = end
+        except ValueError:
+            data = b""  # Drop clients that send invalid messages
+        finally:
+            view.release()
+            del buffer[:offset]
+
+        if not data:
+            selector.unregister(conn)
+            del self._buffers[conn]
+            conn.close()
+
+    def serveForever(self, stopEvent: Optional[threading.Event] = None) -> None:
+        """Accept clients and refresh the matrix until stopped.
+
+        Args:
+            stopEvent: Event that ends the loop when set (default None = forever).
+        """
+        if stopEvent is None:
+            stopEvent = threading.Event()
+
+        # Remove a socket left over from a previous run
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        selector = selectors.DefaultSelector()
+        try:
+            server.bind(self.path)
+            os.chmod(self.path, 0o666)  # Clients do not need root
+            server.listen()
+            server.setblocking(False)
+            selector.register(server, selectors.EVENT_READ)
+
+            period = 1.0 / self.fps
+            nextRefresh = time.monotonic()
+            while not stopEvent.is_set():
+                timeout = max(0.0, nextRefresh - time.monotonic())
+                for key, _ in selector.select(timeout):
+                    if key.fileobj is server:
+                        conn, _ = server.accept()
+                        conn.setblocking(False)
+                        self._buffers[conn] = bytearray()
+                        selector.register(conn, selectors.EVENT_READ)
+                    else:
+                        self._receive(selector, key.fileobj)
+
+                now = time.monotonic()
+                if now >= nextRefresh:
+                    self.led.update()
+                    nextRefresh += period
+                    if nextRefresh < now:
+                        nextRefresh = now + period  # Fell behind, skip ticks
+        finally:
+            for conn in self._buffers:
+                conn.close()
+            self._buffers.clear()
+            selector.close()
+            server.close()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+class LedMatrixClient:
+    """Draw on the LED matrix of a running LedDaemon.
+
+    Mirrors the drawing API of LedMatrix without needing root or
+    initializing the hardware. Drawing methods change the local frame;
+    update() sends it to the daemon.
+
+    Attributes:
+        frame: Local framebuffer as (8, 8, 3) uint8 array.
+    """
+
+    __slots__ = ("frame", "_pixels", "_socket")
+
+    def __init__(self, path: str = DAEMON_SOCKET_PATH):
+        """Connect to the daemon.
+
+        Args:
+            path: Path of the daemon socket (default "/tmp/joypi_ledmatrix.sock").
+
+        Raises:
+            ConnectionError: If the daemon is not running.
+        """
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._socket.connect(path)
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            self._socket.close()
+            raise ConnectionError(f"LED daemon is not running at {path}") from e
+        self.frame = np.zeros((MATRIX_HEIGHT, MATRIX_WIDTH, 3), dtype=np.uint8)
+        self._pixels = self.frame.reshape(MATRIX_LED_COUNT, 3)
+
+    def __enter__(self) -> "LedMatrixClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _send(self, command: int, payload: bytes = b"") -> None:
+        """Send a message to the daemon.
+
+        Args:
+            command: Command byte.
+            payload: Message payload (default empty).
+        """
+        self._socket.sendall(_HEADER.pack(command, len(payload)) + payload)
+
+    def clear(self) -> None:
+        """Turn off all LEDs on the matrix."""
+        self.frame.fill(0)
+        self._send(COMMAND_CLEAR)
+
+    def setPixel(self, position: int, color: ColorTuple) -> None:
+        """Set a single pixel to the specified color.
+
+        Args:
+            position: LED index (0-63).
+            color: RGB color tuple (R, G, B).
+
+        Raises:
+            ValueError: If position is out of range.
+        """
+        if not 0 <= position < MATRIX_LED_COUNT:
+            raise ValueError("Position out of range")
+        self._pixels[position] = LedMatrix._validateColor(color)
+
+    def setAll(self, color: ColorTuple) -> None:
+        """Set all pixels to the same color.
+
+        Args:
+            color: RGB color tuple (R, G, B).
+        """
+        self.frame[:] = LedMatrix._validateColor(color)
+
+    def setBrightness(self, brightness: int) -> None:
+        """Set the brightness of the LED matrix.
+
+        Args:
+            brightness: Brightness level (0-255).
+
+        Raises:
+            ValueError: If brightness is out of range.
+        """
+        if not 0 <= brightness <= 255:
+            raise ValueError("Brightness out of range")
+        self._send(COMMAND_BRIGHTNESS, bytes((brightness,)))
+
+    def setGamma(self, gamma: float = 1.0) -> None:
+        """Set the gamma correction applied on output.
+
+        Args:
+            gamma: Gamma exponent, 1.0 disables correction (default 1.0).
+
+        Raises:
+            ValueError: If gamma is not positive.
+        """
+        if gamma <= 0:
+            raise ValueError("Gamma must be positive")
+        self._send(COMMAND_GAMMA, _FLOAT.pack(gamma))
+
+    def setFadeLevel(self, level: float) -> None:
+        """Scale the output of every frame.
+
+        Args:
+            level: Output scale (0.0 = off, 1.0 = unchanged).
+
+        Raises:
+            ValueError: If level is out of range.
+        """
+        if not 0.0 <= level <= 1.0:
+            raise ValueError("Fade level out of range")
+        self._send(COMMAND_FADE, _FLOAT.pack(level))
+
+    def update(self) -> None:
+        """Send the local framebuffer to the daemon."""
+        self._send(COMMAND_FRAME, self.frame.tobytes())
+
+    def showFrame(self, frame) -> None:
+        """Copy a full frame into the framebuffer and send it.
+
+        Args:
+            frame: Array-like of shape (8, 8, 3) or (64, 3).
+
+        Raises:
+            ValueError: If the frame has the wrong shape.
+        """
+        self.frame[:] = LedMatrix._validateFrame(frame)
+        self.update()
+
+    def showMask(
+        self, mask: int, color: ColorTuple, background: ColorTuple = (0, 0, 0)
+    ) -> None:
+        """Display a monochrome 64-bit pixel mask on the matrix.
+
+        Args:
+            mask: 64-bit pixel mask.
+            color: Color of set pixels as (R, G, B) tuple.
+            background: Color of unset pixels as (R, G, B) tuple (default (0, 0, 0)).
+        """
+        self._pixels[:] = LedMatrix._validateColor(background)
+        self._pixels[LedMatrix._maskToBits(mask)] = LedMatrix._validateColor(color)
+        self.update()
+
+    def showChar(
+        self,
+        char: str,
+        color: ColorTuple,
+        offsetX: int = 1,
+        background: ColorTuple = (0, 0, 0),
+    ) -> None:
+        """Display a single character on the matrix.
+
+        Args:
+            char: Character to display.
+            color: Text color as (R, G, B) tuple.
+            offsetX: Horizontal offset for centering (default 1).
+            background: Background color as (R, G, B) tuple (default (0, 0, 0)).
+        """
+        mask = shiftMask(LedMatrix._getCharMask(char), offsetX)
+        self.showMask(mask, color, background)
+
+    def showText(
+        self,
+        text: str,
+        color: ColorTuple,
+        background: ColorTuple = (0, 0, 0),
+    ) -> None:
+        """Display the first character of a text on the matrix.
+
+        Args:
+            text: Text to display.
+            color: Text color as (R, G, B) tuple.
+            background: Background color as (R, G, B) tuple (default (0, 0, 0)).
+        """
+        if text:
+            self.showChar(text[0], color, background=background)
+
+    def scrollText(
+        self,
+        text: str,
+        color: ColorTuple,
+        delay: float = 0.1,
+        loops: int = 1,
+        background: ColorTuple = (0, 0, 0),
+    ) -> None:
+        """Scroll text from right to left across the matrix (blocking).
+
+        Args:
+            text: Text to display.
+            color: Text color as (R, G, B) tuple.
+            delay: Delay between frames in seconds (default 0.1).
+            loops: Number of repetitions, 0 for infinite (default 1).
+            background: Background color as (R, G, B) tuple (default (0, 0, 0)).
+        """
+        frames = _renderScrollFrames(
+            text,
+            tuple(LedMatrix._validateColor(color)),
+            tuple(LedMatrix._validateColor(background)),
+        )
+        deadline = time.monotonic()
+        for frame in LedMatrix._loopFrames(frames, loops):
+            self.showFrame(frame)
+            deadline += delay
+            time.sleep(max(0.0, deadline - time.monotonic()))
+
+    def close(self) -> None:
+        """Close the connection to the daemon."""
+        self._socket.close()
+
+
+def main() -> None:
+    """Run the LED daemon from the command line."""
+    parser = argparse.ArgumentParser(description="JoyPi Note LED matrix daemon")
+    parser.add_argument("--socket", default=DAEMON_SOCKET_PATH, help="socket path")
+    parser.add_argument("--fps", type=float, default=DAEMON_FPS, help="refresh rate")
+    parser.add_argument(
+        "--brightness", type=int, default=DEFAULT_BRIGHTNESS, help="0-255"
+    )
+    args = parser.parse_args()
+
+    daemon = LedDaemon(LedMatrix(args.brightness), args.socket, args.fps)
+    try:
+        daemon.serveForever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.led.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+from abc import ABC, abstractmethod
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+from .LedMatrix import MATRIX_HEIGHT, MATRIX_WIDTH, ColorTuple, LedMatrix
+
+# Pixel coordinate grids, indexed [y, x]
+_Y, _X = np.mgrid[0:MATRIX_HEIGHT, 0:MATRIX_WIDTH].astype(np.float32)
+_HSV_SECTORS = np.array([5.0, 3.0, 1.0], dtype=np.float32)
+
+
+def hsvToRgb(hue: np.ndarray, saturation=1.0, value=1.0) -> np.ndarray:
+    """Convert HSV arrays to RGB.
+
+    Args:
+        hue: Hue array, 0.0-1.0 (wraps around).
+        saturation: Saturation, scalar or array broadcastable to hue (0.0-1.0).
+        value: Value, scalar or array broadcastable to hue (0.0-1.0).
+
+    Returns:
+        uint8 array of shape hue.shape + (3,).
+    """
+    hue = np.asarray(hue, dtype=np.float32) % 1.0
+    # Position of each channel (R, G, B) on the six sector color wheel
+    k = (_HSV_SECTORS + hue[..., None] * 6.0) % 6.0
+    off = np.clip(np.minimum(k, 4.0 - k), 0.0, 1.0)
+    saturation = np.asarray(saturation, dtype=np.float32)[..., None]
+    value = np.asarray(value, dtype=np.float32)[..., None]
+    rgb = value * (1.0 - saturation * off) * 255.0
+    return np.rint(rgb).astype(np.uint8)
+
+
+class LedEffect(ABC):
+    """Base class for procedural LED matrix effects.
+
+    An effect keeps its state as (8, 8) arrays and computes every frame
+    with whole-array operations. Subclasses implement step().
+
+    Attributes:
+        frame: The last computed frame as (8, 8, 3) uint8 array.
+        level: Overall intensity of the effect (0.0-1.0).
+    """
+
+    __slots__ = ("frame", "level", "_rng")
+
+    def __init__(self, seed: Optional[int] = None):
+        """Initialize the effect.
+
+        Args:
+            seed: Random seed for reproducible effects (default None).
+        """
+        self.frame = np.zeros((MATRIX_HEIGHT, MATRIX_WIDTH, 3), dtype=np.uint8)
+        self.level = 1.0
+        self._rng = np.random.default_rng(seed)
+
+    @abstractmethod
+    def step(self) -> np.ndarray:
+        """Advance the effect by one frame.
+
+        Returns:
+            The new frame as (8, 8, 3) uint8 array (reused between steps).
+        """
+
+    def _shade(self, color: ColorTuple, intensity: np.ndarray) -> np.ndarray:
+        """Write color scaled by an (8, 8) intensity (0.0-1.0) into frame.
+
+        Args:
+            color: RGB color tuple (R, G, B).
+            intensity: Intensity per pixel as (8, 8) float array.
+
+        Returns:
+            The updated frame.
+        """
+        color = np.asarray(color, dtype=np.float32) * self.level
+        self.frame[:] = np.rint(intensity[..., None] * color)
+        return self.frame
+
+    def frames(self, count: int = 0) -> Iterator[np.ndarray]:
+        """Iterate over effect frames.
+
+        Args:
+            count: Number of frames, 0 for infinite (default 0).
+
+        Yields:
+            One (8, 8, 3) frame per step.
+        """
+        produced = 0
+        while count == 0 or produced < count:
+            yield self.step()
+            produced += 1
+
+    def play(self, led: LedMatrix, fps: float = 100, count: int = 0) -> None:
+        """Run the effect on an LedMatrix in the background.
+
+        Stop it with led.stopAnimation().
+
+        Args:
+            led: LedMatrix to play on.
+            fps: Frames per second (default 100).
+            count: Number of frames, 0 for infinite (default 0).
+        """
+        led.play(self.frames(count), 1.0 / fps)
+
+
+class GlintEffect(LedEffect):
+    """Cells that slowly fade out and back in with random re-sparks.
+
+    Attributes:
+        color: Glint color as (R, G, B) tuple.
+    """
+
+    __slots__ = ("color", "_cells")
+
+    def __init__(self, color: ColorTuple, seed: Optional[int] = None):
+        """Initialize the glint effect.
+
+        Args:
+            color: Glint color as (R, G, B) tuple.
+            seed: Random seed (default None).
+        """
+        super().__init__(seed)
+        self.color = color
+        self._cells = self._rng.integers(
+            -255, 256, (MATRIX_HEIGHT, MATRIX_WIDTH), dtype=np.int16
+        )
+
+    def step(self) -> np.ndarray:
+        """Advance the glint by one frame."""
+        cells = self._cells
+        cells -= 1
+        cells[cells <= -255] = 255
+        cells[(cells == 0) & (self._rng.random(cells.shape) < 0.75)] = 5
+        return self._shade(self.color, np.abs(cells) / np.float32(255.0))
+
+
+class SparkleEffect(LedEffect):
+    """Random sparkles that decay over time.
+
+    Attributes:
+        color: Sparkle color as (R, G, B) tuple.
+        density: Chance per pixel and frame to light up (0.0-1.0).
+        decay: Factor the intensity is multiplied with per frame.
+    """
+
+    __slots__ = ("color", "density", "decay", "_intensity")
+
+    def __init__(
+        self,
+        color: ColorTuple,
+        density: float = 0.02,
+        decay: float = 0.9,
+        seed: Optional[int] = None,
+    ):
+        """Initialize the sparkle effect.
+
+        Args:
+            color: Sparkle color as (R, G, B) tuple.
+            density: Chance per pixel and frame to light up (default 0.02).
+            decay: Intensity factor per frame (default 0.9).
+            seed: Random seed (default None).
+        """
+        super().__init__(seed)
+        self.color = color
+        self.density = density
+        self.decay = decay
+        self._intensity = np.zeros((MATRIX_HEIGHT, MATRIX_WIDTH), dtype=np.float32)
+
+    def step(self) -> np.ndarray:
+        """Advance the sparkles by one frame."""
+        intensity = self._intensity
+        intensity *= self.decay
+        intensity[self._rng.random(intensity.shape) < self.density] = 1.0
+        return self._shade(self.color, intensity)
+
+
+class FadeEffect(LedEffect):
+    """A fixed frame that fades in and out (breathing).
+
+    Attributes:
+        period: Frames per full fade cycle.
+        minLevel: Lowest intensity of the cycle (0.0-1.0).
+    """
+
+    __slots__ = ("period", "minLevel", "_base", "_tick")
+
+    def __init__(self, frame, period: int = 100, minLevel: float = 0.0):
+        """Initialize the fade effect.
+
+        Args:
+            frame: Frame of shape (8, 8, 3) or (64, 3), or an (R, G, B) tuple
+                for a single color.
+            period: Frames per full fade cycle (default 100).
+            minLevel: Lowest intensity of the cycle (default 0.0).
+
+        Raises:
+            ValueError: If period is less than 1 or the frame has the wrong shape.
+        """
+        if period < 1:
+            raise ValueError("Period must be at least 1")
+        super().__init__()
+        base = np.asarray(frame, dtype=np.float32)
+        if base.shape != (3,):
+            base = LedMatrix._validateFrame(base)
+        self._base = np.broadcast_to(base, self.frame.shape)
+        self.period = period
+        self.minLevel = minLevel
+        self._tick = 0
+
+    def step(self) -> np.ndarray:
+        """Advance the fade by one frame."""
+        phase = (1.0 - np.cos(2.0 * np.pi * self._tick / self.period)) / 2.0
+        scale = (self.minLevel + (1.0 - self.minLevel) * phase) * self.level
+        self._tick = (self._tick + 1) % self.period
+        np.multiply(self._base, scale, out=self.frame, casting="unsafe")
+        return self.frame
+
+
+class RainbowEffect(LedEffect):
+    """Diagonal HSV rainbow that moves across the matrix.
+
+    Attributes:
+        speed: Hue change per frame.
+        spread: Hue change per pixel along the diagonal.
+    """
+
+    __slots__ = ("speed", "spread", "_hue")
+
+    def __init__(self, speed: float = 0.01, spread: float = 0.06):
+        """Initialize the rainbow effect.
+
+        Args:
+            speed: Hue change per frame (default 0.01).
+            spread: Hue change per pixel along the diagonal (default 0.06).
+        """
+        super().__init__()
+        self.speed = speed
+        self.spread = spread
+        self._hue = 0.0
+
+    def step(self) -> np.ndarray:
+        """Advance the rainbow by one frame."""
+        self._hue = (self._hue + self.speed) % 1.0
+        self.frame[:] = hsvToRgb((_X + _Y) * self.spread + self._hue, 1.0, self.level)
+        return self.frame
+
+
+class PlasmaEffect(LedEffect):
+    """Classic plasma from overlapping sine waves.
+
+    Attributes:
+        speed: Animation time advanced per frame.
+    """
+
+    __slots__ = ("speed", "_time")
+
+    def __init__(self, speed: float = 0.05):
+        """Initialize the plasma effect.
+
+        Args:
+            speed: Animation time advanced per frame (default 0.05).
+        """
+        super().__init__()
+        self.speed = speed
+        self._time = 0.0
+
+    def step(self) -> np.ndarray:
+        """Advance the plasma by one frame."""
+        t = self._time = self._time + self.speed
+        cx = _X + 2.0 * np.sin(t / 3.0)
+        cy = _Y + 2.0 * np.cos(t / 2.0)
+        plasma = (
+            np.sin(_X * 0.8 + t)
+            + np.sin((_Y * 0.6 + t) / 2.0)
+            + np.sin((_X + _Y) * 0.5 + t)
+            + np.sin(np.sqrt(cx * cx + cy * cy) + t)
+        )
+        self.frame[:] = hsvToRgb(plasma / 8.0 + t * 0.05, 1.0, self.level)
+        return self.frame
+
+
+class TrailEffect(LedEffect):
+    """A point bouncing off the edges and leaving a decaying trail.
+
+    Attributes:
+        color: Trail color as (R, G, B) tuple.
+        decay: Factor the trail intensity is multiplied with per frame.
+    """
+
+    __slots__ = ("color", "decay", "_intensity", "_position", "_velocity")
+
+    def __init__(
+        self,
+        color: ColorTuple,
+        decay: float = 0.7,
+        velocity: Optional[Tuple[float, float]] = None,
+        seed: Optional[int] = None,
+    ):
+        """Initialize the trail effect.
+
+        Args:
+            color: Trail color as (R, G, B) tuple.
+            decay: Intensity factor per frame (default 0.7).
+            velocity: Pixels per frame as (x, y), random if None.
+            seed: Random seed (default None).
+        """
+        super().__init__(seed)
+        self.color = color
+        self.decay = decay
+        self._intensity = np.zeros((MATRIX_HEIGHT, MATRIX_WIDTH), dtype=np.float32)
+        self._position = self._rng.uniform(0, [MATRIX_WIDTH - 1, MATRIX_HEIGHT - 1])
+        if velocity is None:
+            velocity = self._rng.uniform([-0.8, -0.73], [1.0, 0.52])
+        self._velocity = np.array(velocity, dtype=np.float64)
+
+    def step(self) -> np.ndarray:
+        """Move the point and fade the trail by one frame."""
+        position, velocity = self._position, self._velocity
+        position += velocity
+
+        # Bounce at the edges
+        limit = (MATRIX_WIDTH - 1, MATRIX_HEIGHT - 1)
+        bounced = (position <= 0) | (position >= limit)
+        velocity[bounced] = -velocity[bounced]
+        np.clip(position, 0, limit, out=position)
+
+        intensity = self._intensity
+        intensity *= self.decay
+        x, y = np.rint(position).astype(int)
+        intensity[y, x] = 1.0
+        return self._shade(self.color, intensity)
@@ -0,0 +1,194 @@
+import os
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .LedMatrix import MATRIX_HEIGHT, MATRIX_WIDTH
+
+IMAGE_CACHE_SIZE: int = 32  # Number of scaled images kept in memory
+SCALE_AREA: str = "area"  # Average all source pixels covered by a target pixel
+SCALE_NEAREST: str = "nearest"  # Take the source pixel at the target pixel center
+
+_WHITESPACE = b" \t\n\r\v\f"
+
+
+def _readHeader(data: bytes, count: int) -> Tuple[List[int], int]:
+    """Read the numbers of a PNM header.
+
+    Args:
+        data: File content, starting with the 2-byte magic.
+        count: Number of header values to read after the magic.
+
+    Returns:
+        Tuple of (values, offset of the first pixel byte).
+
+    Raises:
+        ValueError: If the header is incomplete or not numeric.
+    """
+    values: List[int] = []
+    position = 2
+    while len(values) < count:
+        if position >= len(data):
+            raise ValueError("Incomplete image header")
+        byte = data[position]
+        if byte in _WHITESPACE:
+            position += 1
+        elif byte == ord("#"):  # Comment up to the end of the line
+            end = data.find(b"\n", position)
+            position = len(data) if end < 0 else end + 1
+        else:
+            end = position
+            while end < len(data) and data[end] not in _WHITESPACE:
+                end += 1
+            try:
+                values.append(int(data[position:end]))
+            except ValueError:
+                raise ValueError("Invalid image header") from None
+            position = end
+    return values, position + 1  # A single whitespace follows the header
+
+
+def readImage(path: str, rawSize: Optional[Tuple[int, int]] = None) -> np.ndarray:
+    """Decode a PPM, PGM or raw RGB file.
+
+    Supported are binary and ASCII PPM (P6, P3) and PGM (P5, P2) with 8 or
+    16 bits per sample, and headerless raw RGB files with 8 bits per sample.
+
+    Args:
+        path: Path of the image file.
+        rawSize: (width, height) of a raw RGB file; None for PPM/PGM files
+            (default None).
+
+    Returns:
+        The image as (height, width, 3) uint8 array.
+
+    Raises:
+        ValueError: If the file is not a supported image or is truncated.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+
+    if rawSize is not None:
+        width, height = rawSize
+        if len(data) < width * height * 3:
+            raise ValueError("Raw image is smaller than the given size")
+        pixels = np.frombuffer(data, np.uint8, width * height * 3)
+        return pixels.reshape(height, width, 3).copy()
+
+    magic = data[:2]
+    if magic not in (b"P2", b"P3", b"P5", b"P6"):
+        raise ValueError("Unsupported image format")
+    (width, height, maxValue), offset = _readHeader(data, 3)
+    if not 0 < maxValue < 65536:
+        raise ValueError("Invalid image header")
+
+    channels = 3 if magic in (b"P3", b"P6") else 1
+    count = width * height * channels
+    if magic in (b"P2", b"P3"):
+        samples = np.array(data[offset:].split(), dtype=np.int64)
+    else:
+        dtype = ">u2" if maxValue > 255 else np.uint8  # 16-bit samples are big-endian
+        samples = np.frombuffer(data, dtype, -1, offset)
+    if len(samples) < count:
+        raise ValueError("Image data is truncated")
+
+    samples = samples[:count].reshape(height, width, channels)
+    if maxValue != 255:
+        samples = (samples.astype(np.uint32) * 255 + maxValue // 2) // maxValue
+    image = np.empty((height, width, 3), dtype=np.uint8)
+    image[:] = samples  # Gray images are broadcast to all channels
+    return image
+
+
+def _binEdges(source: int, target: int) -> np.ndarray:
+    """Get the first source index of every target bin."""
+    return np.arange(target) * source // target
+
+
+def scaleImage(
+    image: np.ndarray,
+    width: int = MATRIX_WIDTH,
+    height: int = MATRIX_HEIGHT,
+    method: str = SCALE_AREA,
+) -> np.ndarray:
+    """Scale an image to the given size.
+
+    Args:
+        image: Image as (height, width, 3) array.
+        width: Target width (default 8).
+        height: Target height (default 8).
+        method: SCALE_AREA or SCALE_NEAREST (default SCALE_AREA). Area
+            averaging falls back to nearest sampling when enlarging.
+
+    Returns:
+        The scaled image as (height, width, 3) uint8 array.
+
+    Raises:
+        ValueError: If the method is unknown.
+    """
+    if method not in (SCALE_AREA, SCALE_NEAREST):
+        raise ValueError("Unknown scaling method")
+    sourceHeight, sourceWidth = image.shape[:2]
+
+    if method == SCALE_NEAREST or sourceWidth < width or sourceHeight < height:
+        rows = ((np.arange(height) * 2 + 1) * sourceHeight) // (height * 2)
+        columns = ((np.arange(width) * 2 + 1) * sourceWidth) // (width * 2)
+        return np.ascontiguousarray(image[rows[:, None], columns], dtype=np.uint8)
+
+    # Sum every block of source pixels, then divide by the block sizes
+    rowEdges = _binEdges(sourceHeight, height)
+    columnEdges = _binEdges(sourceWidth, width)
+    sums = np.add.reduceat(image.astype(np.uint32), rowEdges, axis=0)
+    sums = np.add.reduceat(sums, columnEdges, axis=1)
+    rowCounts = np.diff(rowEdges, append=sourceHeight)
+    columnCounts = np.diff(columnEdges, append=sourceWidth)
+    areas = (rowCounts[:, None] * columnCounts)[..., None]
+    return ((sums + areas // 2) // areas).astype(np.uint8)
+
+
+@lru_cache(maxsize=IMAGE_CACHE_SIZE)
+def _loadScaled(
+    path: str,
+    modified: int,
+    width: int,
+    height: int,
+    method: str,
+    rawSize: Optional[Tuple[int, int]],
+) -> np.ndarray:
+    """Read and scale an image; cached per path and modification time."""
+    image = scaleImage(readImage(path, rawSize), width, height, method)
+    image.setflags(write=False)
+    return image
+
+
+def loadImage(
+    path: str,
+    width: int = MATRIX_WIDTH,
+    height: int = MATRIX_HEIGHT,
+    method: str = SCALE_AREA,
+    rawSize: Optional[Tuple[int, int]] = None,
+) -> np.ndarray:
+    """Load an image file scaled to the matrix (or a canvas) size.
+
+    Results are kept in an LRU cache keyed by path and modification time,
+    so showing the same file again only costs a stat() call, and a changed
+    file is read again automatically.
+
+    Args:
+        path: Path of a PPM, PGM or raw RGB file.
+        width: Target width (default 8).
+        height: Target height (default 8).
+        method: SCALE_AREA or SCALE_NEAREST (default SCALE_AREA).
+        rawSize: (width, height) of a raw RGB file (default None).
+
+    Returns:
+        Read-only (height, width, 3) uint8 array, e.g. for showFrame().
+
+    Raises:
+        ValueError: If the file is not a supported image.
+    """
+    path = os.path.abspath(path)
+    modified = os.stat(path).st_mtime_ns
+    rawSize = tuple(rawSize) if rawSize is not None else None
+    return _loadScaled(path, modified, width, height, method, rawSize)
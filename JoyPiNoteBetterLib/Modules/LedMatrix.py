@@ -1,18 +1,32 @@
+import bisect
 import grp
 import os
 import sys
+import threading
 import time
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from rpi_ws281x import Color, PixelStrip
+import numpy as np
+from rpi_ws281x import PixelStrip
 
 # Matrix configuration constants
 MATRIX_LED_COUNT: int = 64  # Number of LED pixels
+MATRIX_WIDTH: int = 8  # Pixels per row
+MATRIX_HEIGHT: int = 8  # Number of rows
 MATRIX_PIN: int = 12  # GPIO pin (must support PWM)
 MATRIX_FREQ_HZ: int = 800000  # LED signal frequency
 MATRIX_DMA: int = 10  # DMA channel
 MATRIX_CHANNEL: int = 0  # Set to 1 if GPIOs 13, 19, 41, 45 or 53
 DEFAULT_BRIGHTNESS: int = 100  # 0-255
+SCROLL_CACHE_SIZE: int = 32  # Number of pre-rendered scroll texts kept in memory
+TEXT_LAYOUT_CACHE_SIZE: int = 128  # Number of laid out texts kept in memory
+SPACE_WIDTH: int = 2  # Columns of a space in proportional text
+LED_CHANNEL_MILLIAMPS: float = 20.0  # Current of one color channel at full level
+LED_IDLE_MILLIAMPS: float = 1.0  # Current of one LED while off
+TRANSITION_CACHE_SIZE: int = 32  # Number of rendered transitions kept in memory
+# Upper bounds of the show() latency histogram buckets in microseconds
+SHOW_LATENCY_BUCKETS_US: Tuple[int, ...] = (100, 250, 500, 1000, 2500, 5000, 10000)
 
 # Legacy aliases for backwards compatibility
 matrixLedCount = MATRIX_LED_COUNT
@@ -25,6 +39,18 @@ defaultMatrixBrightness = DEFAULT_BRIGHTNESS
 # Type alias for RGB color tuples
 ColorTuple = Tuple[int, int, int]
 
+# Transition kinds for LedMatrix.transition()
+TRANSITION_CROSSFADE: str = "crossfade"  # Blend all pixels at once
+TRANSITION_WIPE: str = "wipe"  # Reveal the new frame column by column from the left
+TRANSITION_DISSOLVE: str = "dissolve"  # Reveal the new frame pixel by pixel
+TRANSITION_SLIDE: str = "slide"  # Push the old frame out to the left
+TRANSITIONS: Tuple[str, ...] = (
+    TRANSITION_CROSSFADE,
+    TRANSITION_WIPE,
+    TRANSITION_DISSOLVE,
+    TRANSITION_SLIDE,
+)
+
 # 5x7 font for letters, numbers, and special characters (each row is a column)
 FONT_5X7 = {
     # Uppercase letters
@@ -123,17 +149,388 @@ FONT_5X7 = {
 }
 
 
+def _trimGlyph(columns: List[int]) -> Tuple[int, ...]:
+    """Remove the empty columns left and right of a glyph."""
+    columns = [column & 0x7F for column in columns]  # Only 7 rows are shown
+    lit = [x for x, column in enumerate(columns) if column]
+    if not lit:
+        return (0,) * SPACE_WIDTH
+    return tuple(columns[lit[0] : lit[-1] + 1])
+
+
+# FONT_5X7 with trimmed glyph widths for proportional text
+_GLYPH_COLUMNS: Dict[str, Tuple[int, ...]] = {
+    char: _trimGlyph(columns) for char, columns in FONT_5X7.items()
+}
+
+
+def _pairSpacing(left: int, right: int) -> int:
+    """Get the blank columns between two glyphs from their facing columns.
+
+    Glyphs whose facing pixels are at least two rows apart (like "To")
+    are drawn without a gap, all others get one blank column.
+    """
+    if not (left and right):
+        return 1
+    return 0 if (left | left << 1 | left >> 1) & right == 0 else 1
+
+
+@lru_cache(maxsize=TEXT_LAYOUT_CACHE_SIZE)
+def layoutText(text: str) -> Tuple[int, ...]:
+    """Lay out text with proportional glyph widths and per-pair spacing.
+
+    Results are kept in an LRU cache, so repeated texts skip the layout.
+
+    Args:
+        text: Text to lay out; unknown characters are shown as spaces.
+
+    Returns:
+        Column bytes of the text (bit y set = pixel lit in row y).
+    """
+    space = _GLYPH_COLUMNS[" "]
+    columns: List[int] = []
+    previous = 0
+    for char in text:
+        glyph = _GLYPH_COLUMNS.get(char, space)
+        if columns:
+            columns.extend((0,) * _pairSpacing(previous, glyph[0]))
+        columns.extend(glyph)
+        previous = glyph[-1]
+    return tuple(columns)
+
+
+# 64-bit pixel masks: bit (y << 3) + x is the LED at x, y
+FULL_MASK: int = (1 << MATRIX_LED_COUNT) - 1
+_COLUMN_MASK: int = 0x0101010101010101  # Column x = 0 of every row
+
+
+def _columnsFrom(x: int) -> int:
+    """Get a mask with all pixels in columns x..7 set."""
+    mask = 0
+    for col in range(x, MATRIX_WIDTH):
+        mask |= _COLUMN_MASK << col
+    return mask
+
+
+_COLUMNS_FROM = [_columnsFrom(x) for x in range(MATRIX_WIDTH)]
+
+
+def shiftMask(mask: int, dx: int, dy: int = 0) -> int:
+    """Shift a pixel mask by whole pixels without wrapping.
+
+    Args:
+        mask: 64-bit pixel mask.
+        dx: Columns to move right (negative moves left).
+        dy: Rows to move down (negative moves up).
+
+    Returns:
+        The shifted mask; pixels moved off the matrix are dropped.
+    """
+    if not (-MATRIX_WIDTH < dx < MATRIX_WIDTH and -MATRIX_HEIGHT < dy < MATRIX_HEIGHT):
+        return 0
+    if dx > 0:
+        mask = (mask << dx) & _COLUMNS_FROM[dx]
+    elif dx < 0:
+        mask = (mask >> -dx) & ~_COLUMNS_FROM[MATRIX_WIDTH + dx]
+    if dy > 0:
+        mask <<= dy << 3
+    elif dy < 0:
+        mask >>= -dy << 3
+    return mask & FULL_MASK
+
+
+def _compileGlyph(columns: List[int]) -> int:
+    """Convert 5x7 font columns into a pixel mask placed at x = 0."""
+    mask = 0
+    for x, column in enumerate(columns):
+        for y in range(7):
+            if column & (1 << y):
+                mask |= 1 << ((y << 3) + x)
+    return mask
+
+
+# FONT_5X7 compiled to pixel masks at x = 0 (move with shiftMask)
+FONT_MASKS: Dict[str, int] = {
+    char: _compileGlyph(columns) for char, columns in FONT_5X7.items()
+}
+
+# Transforms are 64-entry index tables: pixel i of the result is taken from
+# pixel transform[i] of the source, so a whole frame moves with one gather.
+_Y, _X = np.divmod(np.arange(MATRIX_LED_COUNT), MATRIX_WIDTH)
+IDENTITY_TRANSFORM: np.ndarray = np.arange(MATRIX_LED_COUNT)
+_ROTATIONS = [
+    IDENTITY_TRANSFORM,
+    ((7 - _X) << 3) + _Y,  # 90 degrees clockwise
+    ((7 - _Y) << 3) + (7 - _X),  # 180 degrees
+    (_X << 3) + (7 - _Y),  # 270 degrees clockwise
+]
+_MIRROR_X = (_Y << 3) + (7 - _X)
+_MIRROR_Y = ((7 - _Y) << 3) + _X
+for _table in (*_ROTATIONS, _MIRROR_X, _MIRROR_Y):
+    _table.setflags(write=False)
+
+
+def rotateTransform(degrees: int) -> np.ndarray:
+    """Get the transform that rotates a frame clockwise.
+
+    Args:
+        degrees: Rotation, a multiple of 90.
+
+    Returns:
+        Read-only 64-entry transform table.
+
+    Raises:
+        ValueError: If degrees is not a multiple of 90.
+    """
+    if degrees % 90:
+        raise ValueError("Rotation must be a multiple of 90 degrees")
+    return _ROTATIONS[(degrees // 90) % 4]
+
+
+def mirrorTransform(horizontal: bool = True) -> np.ndarray:
+    """Get the transform that mirrors a frame.
+
+    Args:
+        horizontal: True to swap left and right, False to swap top and
+            bottom (default True).
+
+    Returns:
+        Read-only 64-entry transform table.
+    """
+    return _MIRROR_X if horizontal else _MIRROR_Y
+
+
+@lru_cache(maxsize=MATRIX_LED_COUNT)
+def _shiftTable(dx: int, dy: int) -> np.ndarray:
+    """Build the cyclic shift table for normalized offsets."""
+    table = (((_Y - dy) % MATRIX_HEIGHT) << 3) + ((_X - dx) % MATRIX_WIDTH)
+    table.setflags(write=False)
+    return table
+
+
+def shiftTransform(dx: int, dy: int = 0) -> np.ndarray:
+    """Get the transform that shifts a frame with wrap-around.
+
+    Args:
+        dx: Columns to move right (negative moves left).
+        dy: Rows to move down (negative moves up).
+
+    Returns:
+        Read-only 64-entry transform table.
+    """
+    return _shiftTable(dx % MATRIX_WIDTH, dy % MATRIX_HEIGHT)
+
+
+def composeTransforms(*transforms: np.ndarray) -> np.ndarray:
+    """Combine transforms into one table, applied in the given order.
+
+    Args:
+        *transforms: 64-entry transform tables.
+
+    Returns:
+        A single 64-entry transform table.
+    """
+    result = IDENTITY_TRANSFORM
+    for transform in transforms:
+        result = result[transform]
+    return result
+
+
+def transformFrame(frame: np.ndarray, transform: np.ndarray) -> np.ndarray:
+    """Apply a transform to a frame.
+
+    Args:
+        frame: Frame of shape (8, 8, 3).
+        transform: 64-entry transform table.
+
+    Returns:
+        New (8, 8, 3) frame.
+    """
+    pixels = np.asarray(frame).reshape(MATRIX_LED_COUNT, -1)
+    return pixels[transform].reshape(MATRIX_HEIGHT, MATRIX_WIDTH, -1)
+
+
+class _FrameStats:
+    """Frame timing counters collected by LedMatrix.update()."""
+
+    __slots__ = (
+        "frames",
+        "renderNs",
+        "flushNs",
+        "maxFlushNs",
+        "histogram",
+        "lastShow",
+        "intervals",
+        "intervalMean",
+        "intervalM2",
+    )
+
+    def __init__(self):
+        self.frames = 0
+        self.renderNs = 0
+        self.flushNs = 0
+        self.maxFlushNs = 0
+        self.histogram = [0] * (len(SHOW_LATENCY_BUCKETS_US) + 1)
+        self.lastShow: Optional[int] = None
+        # Running mean and variance of the time between shows (Welford)
+        self.intervals = 0
+        self.intervalMean = 0.0
+        self.intervalM2 = 0.0
+
+    def record(self, start: int, flushStart: int, end: int) -> None:
+        """Add one pushed frame from its perf_counter_ns() timestamps."""
+        flush = end - flushStart
+        self.frames += 1
+        self.renderNs += flushStart - start
+        self.flushNs += flush
+        self.maxFlushNs = max(self.maxFlushNs, flush)
+        self.histogram[bisect.bisect_left(SHOW_LATENCY_BUCKETS_US, flush / 1000)] += 1
+
+        if self.lastShow is not None:
+            interval = flushStart - self.lastShow
+            self.intervals += 1
+            delta = interval - self.intervalMean
+            self.intervalMean += delta / self.intervals
+            self.intervalM2 += delta * (interval - self.intervalMean)
+        self.lastShow = flushStart
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the counters as a dictionary (times in milliseconds)."""
+        frames = max(self.frames, 1)
+        labels = [f"<={bound}us" for bound in SHOW_LATENCY_BUCKETS_US]
+        labels.append(f">{SHOW_LATENCY_BUCKETS_US[-1]}us")
+        jitter = (self.intervalM2 / self.intervals) ** 0.5 if self.intervals else 0.0
+        return {
+            "frames": self.frames,
+            "fps": 1e9 / self.intervalMean if self.intervalMean else 0.0,
+            "jitterMs": jitter / 1e6,
+            "renderMs": self.renderNs / frames / 1e6,
+            "flushMs": self.flushNs / frames / 1e6,
+            "maxFlushMs": self.maxFlushNs / 1e6,
+            "showLatency": dict(zip(labels, self.histogram)),
+        }
+
+
+class _StripWriter:
+    """Passes packed pixel values to a PixelStrip, skipping unchanged ones.
+
+    Keeps the values last written to the strip buffer, so every user of
+    the same strip (LedMatrix, LedCanvas) diffs against its real content.
+    """
+
+    __slots__ = ("strip", "_packBuffer", "_packed", "_written")
+
+    def __init__(self, strip: PixelStrip, count: int):
+        """Initialize the writer.
+
+        Args:
+            strip: Initialized PixelStrip.
+            count: Number of LEDs written.
+        """
+        self.strip = strip
+        # Little-endian BGR0 bytes, viewed as the 0x00RRGGBB values PixelStrip expects
+        self._packBuffer = np.zeros((count, 4), dtype=np.uint8)
+        self._packed = self._packBuffer.view("<u4").reshape(count)
+        self._written = np.zeros_like(self._packed)  # Values in the strip buffer
+
+    def write(self, pixels: np.ndarray, full: bool = False) -> int:
+        """Pack RGB pixels into the strip buffer.
+
+        Only pixels whose value differs from the last write are passed to
+        the strip, so small changes cost only a few calls.
+
+        Args:
+            pixels: (count, 3) uint8 array in strip order.
+            full: Write all pixels, not only changed ones (default False).
+
+        Returns:
+            Number of pixels passed to the strip.
+        """
+        self._packBuffer[:, 2::-1] = pixels  # RGB -> BGR byte order
+        packed = self._packed
+        values = packed.tolist()
+        setPixelColor = self.strip.setPixelColor
+        if full:
+            for i, value in enumerate(values):
+                setPixelColor(i, value)
+            changed = len(values)
+        else:
+            indices = np.flatnonzero(packed != self._written).tolist()
+            for i in indices:
+                setPixelColor(i, values[i])
+            changed = len(indices)
+        self._written[:] = packed
+        return changed
+
+
 class LedMatrix:
     """8x8 NeoPixel LED matrix controller with optimized rendering.
 
     Provides methods for displaying pixels, characters, and scrolling text
     on an 8x8 WS281x LED matrix.
 
+    All drawing methods write into ``frame``; ``update()`` packs the whole
+    frame into the PixelStrip buffer and pushes it to the LEDs. Frames equal
+    to the last pushed one are skipped, so calling ``update()`` at a fixed
+    rate only costs a DMA transfer when the content changed.
+
+    In indexed mode ``update()`` first expands ``indexFrame`` through
+    ``palette`` into ``frame``, so palette effects cost one palette write.
+
+    For drawing from other threads, render into ``backFrame`` and publish
+    it with ``swap()``; the next ``update()`` takes it over as a whole.
+
     Attributes:
         matrix: The underlying PixelStrip instance.
+        frame: Framebuffer as (8, 8, 3) uint8 array, indexed [y, x, channel].
+        backFrame: Back buffer as (8, 8, 3) uint8 array, published by swap().
+        indexFrame: Palette indices as (8, 8) uint8 array (indexed mode).
+        palette: Palette as (256, 3) uint8 array (indexed mode).
     """
 
-    __slots__ = ("matrix", "_numPixels", "_colorCache", "_black")
+    __slots__ = (
+        "matrix",
+        "frame",
+        "indexFrame",
+        "palette",
+        "backFrame",
+        "_pixels",
+        "_writer",
+        "_shown",
+        "_forceShow",
+        "_framesSent",
+        "_framesSkipped",
+        "_lock",
+        "_animationThread",
+        "_animationStop",
+        "_droppedFrames",
+        "_gammaCurve",
+        "_fadeLevel",
+        "_lut",
+        "_output",
+        "_indices",
+        "_indexed",
+        "_pendingFrame",
+        "_framePublished",
+        "_swapLock",
+        "_transform",
+        "_transformed",
+        "_stats",
+        "_maxFps",
+        "_flushThread",
+        "_flushRequest",
+        "_flushStop",
+        "_flushForce",
+        "_asyncFlush",
+        "_queuedFrame",
+        "_queuedSequence",
+        "_flushedSequence",
+        "_flushDone",
+        "_flushing",
+        "_powerLimit",
+        "_powerEstimate",
+        "_limited",
+    )
 
     # GPIO pins that require root (PWM/PCM mode)
     _PWM_PINS = {12, 13, 18, 19, 21, 40, 41, 45, 52, 53}
@@ -218,23 +615,68 @@ class LedMatrix:
         # Initialize library
         self.matrix.begin()
 
-        # Cache frequently used values
-        self._numPixels = self.matrix.numPixels()
-        self._colorCache: dict = {}  # Cache Color objects
-        self._black = Color(0, 0, 0)
-
-    def _getColor(self, color: ColorTuple) -> int:
-        """Get or create a cached Color object for the given RGB tuple.
-
-        Args:
-            color: RGB color tuple (R, G, B).
-
-        Returns:
-            Cached Color integer value.
-        """
-        if color not in self._colorCache:
-            self._colorCache[color] = Color(*color)
-        return self._colorCache[color]
+        # Framebuffer and a flat (64, 3) view of it in strip order
+        self.frame = np.zeros((MATRIX_HEIGHT, MATRIX_WIDTH, 3), dtype=np.uint8)
+        self._pixels = self.frame.reshape(MATRIX_LED_COUNT, 3)
+
+        # Diff writes into the strip buffer (shared with an LedCanvas on this strip)
+        self._writer = _StripWriter(self.matrix, MATRIX_LED_COUNT)
+
+        # Copy of the last pushed frame for skipping unchanged updates
+        self._shown = np.zeros_like(self._pixels)
+        self._forceShow = True
+        self._framesSent = 0
+        self._framesSkipped = 0
+        self._lock = threading.Lock()
+
+        # Background animation state
+        self._animationThread: Optional[threading.Thread] = None
+        self._animationStop: Optional[threading.Event] = None
+        self._droppedFrames = 0
+
+        # Output stage: gamma and fade lookup table (None = identity)
+        self._gammaCurve = np.arange(256, dtype=np.float32)
+        self._fadeLevel = 1.0
+        self._lut: Optional[np.ndarray] = None
+        self._output = np.zeros_like(self._pixels)
+
+        # Indexed color mode
+        self.indexFrame = np.zeros((MATRIX_HEIGHT, MATRIX_WIDTH), dtype=np.uint8)
+        self.palette = np.zeros((256, 3), dtype=np.uint8)
+        self._indices = self.indexFrame.reshape(MATRIX_LED_COUNT)
+        self._indexed = False
+
+        # Double buffering: backFrame -> swap() -> pending -> update() -> frame
+        self.backFrame = np.zeros_like(self.frame)
+        self._pendingFrame = np.zeros_like(self.frame)
+        self._framePublished = False
+        self._swapLock = threading.Lock()
+
+        # Output transform (None = identity)
+        self._transform: Optional[np.ndarray] = None
+        self._transformed = np.zeros_like(self._pixels)
+
+        # Frame timing counters (None = disabled)
+        self._stats: Optional[_FrameStats] = None
+
+        # Flush thread: update() queues, the thread pushes the newest frame,
+        # optionally at most _maxFps times per second (None = no limit)
+        self._maxFps: Optional[float] = None
+        self._asyncFlush = False
+        self._flushThread: Optional[threading.Thread] = None
+        self._flushRequest = threading.Event()
+        self._flushStop = threading.Event()
+        self._flushForce = False
+        self._queuedFrame = np.zeros_like(self._pixels)
+        self._flushing = np.zeros_like(self._pixels)
+        self._queuedSequence = 0
+        self._flushedSequence = 0
+        self._flushDone = threading.Condition()
+
+        # Power budget in mA (None = unlimited) and estimate of the last frame
+        self._powerLimit: Optional[float] = None
+        self._powerEstimate = 0.0
+        self._limited = np.zeros_like(self._pixels)
 
     @staticmethod
     def _validateColor(color: ColorTuple) -> ColorTuple:
@@ -253,11 +695,50 @@ class LedMatrix:
             raise ValueError("Color must be (R, G, B) tuple")
         return color
 
+    @staticmethod
+    def _validateFrame(frame) -> np.ndarray:
+        """Validate that the frame has the shape of the matrix.
+
+        Args:
+            frame: Array-like of shape (8, 8, 3) or (64, 3).
+
+        Returns:
+            The frame as (8, 8, 3) array.
+
+        Raises:
+            ValueError: If the frame has the wrong shape.
+        """
+        frame = np.asarray(frame)
+        if frame.shape == (MATRIX_LED_COUNT, 3):
+            frame = frame.reshape(MATRIX_HEIGHT, MATRIX_WIDTH, 3)
+        elif frame.shape != (MATRIX_HEIGHT, MATRIX_WIDTH, 3):
+            raise ValueError("Frame must have shape (8, 8, 3) or (64, 3)")
+        return frame
+
+    @staticmethod
+    def _validateFrames(frames) -> np.ndarray:
+        """Validate that frames is a sequence of matrix frames.
+
+        Args:
+            frames: Array-like of shape (n, 8, 8, 3) or (n, 64, 3).
+
+        Returns:
+            The frames as (n, 8, 8, 3) uint8 array.
+
+        Raises:
+            ValueError: If the frames have the wrong shape.
+        """
+        frames = np.asarray(frames, dtype=np.uint8)
+        if frames.ndim == 3 and frames.shape[1:] == (MATRIX_LED_COUNT, 3):
+            frames = frames.reshape(-1, MATRIX_HEIGHT, MATRIX_WIDTH, 3)
+        elif frames.ndim != 4 or frames.shape[1:] != (MATRIX_HEIGHT, MATRIX_WIDTH, 3):
+            raise ValueError("Frames must have shape (n, 8, 8, 3) or (n, 64, 3)")
+        return frames
+
     def clear(self) -> None:
         """Turn off all LEDs on the matrix."""
-        for i in range(self._numPixels):
-            self.matrix.setPixelColor(i, self._black)
-        self.matrix.show()
+        self.frame.fill(0)
+        self.update()
 
     def setPixel(self, position: int, color: ColorTuple) -> None:
         """Set a single pixel to the specified color.
@@ -271,8 +752,7 @@ class LedMatrix:
         """
         if not 0 <= position < MATRIX_LED_COUNT:
             raise ValueError("Position out of range")
-        r, g, b = self._validateColor(color)
-        self.matrix.setPixelColorRGB(position, r, g, b)
+        self._pixels[position] = self._validateColor(color)
 
     def setBrightness(self, brightness: int) -> None:
         """Set the brightness of the LED matrix.
@@ -286,6 +766,145 @@ class LedMatrix:
         if not 0 <= brightness <= 255:
             raise ValueError("Brightness out of range")
         self.matrix.setBrightness(brightness)
+        self._forceShow = True
+
+    def setGamma(self, gamma: float = 1.0) -> None:
+        """Set the gamma correction applied to every frame on output.
+
+        WS281x LEDs look too bright at low values; a gamma around 2.2 makes
+        fades and gradients appear even. The framebuffer itself is not changed.
+
+        Args:
+            gamma: Gamma exponent, 1.0 disables correction (default 1.0).
+
+        Raises:
+            ValueError: If gamma is not positive.
+        """
+        if gamma <= 0:
+            raise ValueError("Gamma must be positive")
+        levels = np.arange(256, dtype=np.float32) / 255.0
+        self._gammaCurve = np.power(levels, gamma, dtype=np.float32) * 255.0
+        self._buildLut()
+
+    def setFadeLevel(self, level: float) -> None:
+        """Scale the output of every frame without touching the framebuffer.
+
+        Unlike setBrightness(), this is applied in software through the
+        output lookup table, so it is cheap to change on every frame for
+        fade effects.
+
+        Args:
+            level: Output scale (0.0 = off, 1.0 = unchanged).
+
+        Raises:
+            ValueError: If level is out of range.
+        """
+        if not 0.0 <= level <= 1.0:
+            raise ValueError("Fade level out of range")
+        self._fadeLevel = level
+        self._buildLut()
+
+    def _buildLut(self) -> None:
+        """Rebuild the output lookup table from gamma curve and fade level."""
+        lut = np.rint(self._gammaCurve * self._fadeLevel).astype(np.uint8)
+        identity = self._fadeLevel == 1.0 and np.array_equal(lut, np.arange(256))
+        self._lut = None if identity else lut
+        self._forceShow = True
+
+    def _renderOutput(self, pixels: np.ndarray) -> np.ndarray:
+        """Apply the output stage to a frame.
+
+        Args:
+            pixels: (64, 3) uint8 array in strip order.
+
+        Returns:
+            The (64, 3) pixels to write to the strip.
+        """
+        if self._transform is not None:
+            pixels = np.take(pixels, self._transform, axis=0, out=self._transformed)
+        if self._lut is not None:
+            pixels = np.take(self._lut, pixels, out=self._output)
+        if self._powerLimit is None:
+            return pixels
+
+        # Current rises linearly with every channel level and the brightness
+        perLevel = LED_CHANNEL_MILLIAMPS / 255.0 * self.matrix.getBrightness() / 255.0
+        idle = LED_IDLE_MILLIAMPS * MATRIX_LED_COUNT
+        active = int(pixels.sum(dtype=np.uint32)) * perLevel
+        self._powerEstimate = idle + active
+        if self._powerEstimate <= self._powerLimit or active == 0:
+            return pixels
+        scale = max(self._powerLimit - idle, 0.0) / active
+        return np.multiply(pixels, scale, out=self._limited, casting="unsafe")
+
+    def setPowerLimit(self, milliamps: Optional[float]) -> None:
+        """Limit the estimated current draw of the matrix.
+
+        Every frame's current is estimated from its channel levels and the
+        brightness (LED_CHANNEL_MILLIAMPS per channel at full level plus
+        LED_IDLE_MILLIAMPS per LED). Frames above the limit are scaled down
+        evenly on output until they fit; all other frames are unchanged.
+
+        Args:
+            milliamps: Current budget of the whole matrix in mA, None to
+                disable the limit.
+
+        Raises:
+            ValueError: If the budget is not above the idle current of all
+                LEDs (64 * LED_IDLE_MILLIAMPS).
+        """
+        if milliamps is not None and milliamps <= LED_IDLE_MILLIAMPS * MATRIX_LED_COUNT:
+            raise ValueError("Power limit must be above the idle current")
+        self._powerLimit = milliamps
+        self._forceShow = True
+
+    def getPowerEstimate(self) -> float:
+        """Get the estimated current of the last pushed frame before limiting.
+
+        Only updated while a power limit is set.
+
+        Returns:
+            Estimated current in mA.
+        """
+        return self._powerEstimate
+
+    def setTransform(self, transform: Optional[np.ndarray] = None) -> None:
+        """Set the transform applied to every frame on output.
+
+        Use it for the mounting orientation or for wrap-around effects; the
+        framebuffer itself is not changed. Combine several transforms with
+        composeTransforms() to keep the cost at one gather.
+
+        Args:
+            transform: 64-entry transform table (see rotateTransform(),
+                mirrorTransform(), shiftTransform()), None to disable.
+
+        Raises:
+            ValueError: If the table has the wrong shape or values.
+        """
+        if transform is not None:
+            transform = np.asarray(transform, dtype=np.intp)
+            if transform.shape != (MATRIX_LED_COUNT,):
+                raise ValueError("Transform must have 64 entries")
+            if transform.min() < 0 or transform.max() >= MATRIX_LED_COUNT:
+                raise ValueError("Transform entries must be 0-63")
+            if np.array_equal(transform, IDENTITY_TRANSFORM):
+                transform = None
+        self._transform = transform
+        self._forceShow = True
+
+    def blit(self, sprite, x: int, y: int) -> None:
+        """Draw a sprite into the framebuffer, clipped at the matrix edges.
+
+        Call update() to show the result.
+
+        Args:
+            sprite: Sprite from a SpriteAtlas (see LedSprites).
+            x: Column of the left sprite edge (may be off the matrix).
+            y: Row of the top sprite edge (may be off the matrix).
+        """
+        target, source = sprite.placement(x, y)
+        self._pixels[target] = sprite.atlas.colors[source]
 
     def setAll(self, color: ColorTuple) -> None:
         """Set all pixels to the same color.
@@ -293,13 +912,474 @@ class LedMatrix:
         Args:
             color: RGB color tuple (R, G, B).
         """
-        c = self._getColor(self._validateColor(color))
-        for i in range(self._numPixels):
-            self.matrix.setPixelColor(i, c)
+        self.frame[:] = self._validateColor(color)
+
+    def setIndexedMode(self, enabled: bool) -> None:
+        """Enable or disable the palette-indexed color mode.
 
-    def update(self) -> None:
-        """Push the current pixel buffer to the LED matrix."""
-        self.matrix.show()
+        While enabled, update() overwrites the framebuffer with the palette
+        colors of indexFrame, so draw with setPixelIndex() or indexFrame
+        instead of the RGB methods.
+
+        Args:
+            enabled: True to enable indexed mode, False for RGB mode.
+        """
+        self._indexed = enabled
+
+    def setPalette(self, colors) -> None:
+        """Replace the palette used in indexed mode.
+
+        Entries after the given colors are set to black.
+
+        Args:
+            colors: Sequence of up to 256 (R, G, B) tuples.
+
+        Raises:
+            ValueError: If there are too many colors or they are not RGB.
+        """
+        colors = np.asarray(colors, dtype=np.uint8).reshape(-1, 3)
+        if len(colors) > 256:
+            raise ValueError("Palette can hold at most 256 colors")
+        self.palette[: len(colors)] = colors
+        self.palette[len(colors) :] = 0
+
+    def setPaletteColor(self, index: int, color: ColorTuple) -> None:
+        """Set a single palette entry.
+
+        Args:
+            index: Palette index (0-255).
+            color: RGB color tuple (R, G, B).
+
+        Raises:
+            ValueError: If index is out of range.
+        """
+        if not 0 <= index <= 255:
+            raise ValueError("Palette index out of range")
+        self.palette[index] = self._validateColor(color)
+
+    def rotatePalette(self, start: int = 0, end: int = 256, step: int = 1) -> None:
+        """Cycle the palette entries start..end-1 by step positions.
+
+        Args:
+            start: First palette index of the cycled range (default 0).
+            end: End of the cycled range, exclusive (default 256).
+            step: Positions to rotate towards higher indices (default 1).
+        """
+        self.palette[start:end] = np.roll(self.palette[start:end], step, axis=0)
+
+    def setPixelIndex(self, position: int, index: int) -> None:
+        """Set a single pixel to a palette index (indexed mode).
+
+        Args:
+            position: LED index (0-63).
+            index: Palette index (0-255).
+
+        Raises:
+            ValueError: If position or index is out of range.
+        """
+        if not 0 <= position < MATRIX_LED_COUNT:
+            raise ValueError("Position out of range")
+        if not 0 <= index <= 255:
+            raise ValueError("Palette index out of range")
+        self._indices[position] = index
+
+    def swap(self) -> None:
+        """Publish the finished back buffer for the next update().
+
+        Only the short copy into the pending buffer is locked, so producers
+        never wait for a running transfer. backFrame keeps its content and
+        can be drawn on incrementally. If swap() is called several times
+        before an update(), only the newest frame is shown.
+        """
+        with self._swapLock:
+            self._pendingFrame[:] = self.backFrame
+            self._framePublished = True
+
+    def showFrame(self, frame) -> None:
+        """Copy a full frame into the framebuffer and push it to the matrix.
+
+        Args:
+            frame: Array-like of shape (8, 8, 3) or (64, 3) with RGB values 0-255.
+
+        Raises:
+            ValueError: If the frame has the wrong shape.
+        """
+        self.frame[:] = self._validateFrame(frame)
+        self.update()
+
+    def setMaxFps(self, fps: Optional[float]) -> None:
+        """Limit how often frames are pushed to the matrix.
+
+        While a limit is set, update() only queues the frame and returns at
+        once. A background thread pushes the newest queued frame at most
+        fps times per second, so all update() calls within one frame period,
+        from any number of threads, result in a single transfer.
+
+        Args:
+            fps: Maximum frames per second, None to remove the limit.
+
+        Raises:
+            ValueError: If fps is not positive.
+        """
+        if fps is not None and fps <= 0:
+            raise ValueError("FPS must be positive")
+        self._stopFlushThread()
+        self._maxFps = fps
+        self._startFlushThread()
+
+    def getMaxFps(self) -> Optional[float]:
+        """Get the frame rate limit set with setMaxFps().
+
+        Returns:
+            Maximum frames per second, or None if not limited.
+        """
+        return self._maxFps
+
+    def setAsyncFlush(self, enabled: bool) -> None:
+        """Push frames from a background thread instead of the caller.
+
+        While enabled, update() copies the framebuffer into a queue slot and
+        returns without waiting for the strip transfer. The flush thread
+        always pushes the newest queued frame; frames replaced before it got
+        to them are dropped, never shown late. Use flush() to wait until a
+        frame is on the LEDs. Disabling pushes a frame still in the queue.
+
+        Args:
+            enabled: True to push in the background, False to push on the
+                caller's thread again.
+        """
+        self._stopFlushThread()
+        self._asyncFlush = enabled
+        self._startFlushThread()
+
+    def isAsyncFlush(self) -> bool:
+        """Check if frames are pushed from the flush thread.
+
+        Returns:
+            True if setAsyncFlush() or setMaxFps() started the flush thread.
+        """
+        return self._flushThread is not None
+
+    def _startFlushThread(self) -> None:
+        """Start the flush thread if async flushing or a rate limit is set."""
+        if not self._asyncFlush and self._maxFps is None:
+            return
+        period = 0.0 if self._maxFps is None else 1.0 / self._maxFps
+        self._flushThread = threading.Thread(
+            target=self._runFlush, args=(period,), daemon=True
+        )
+        self._flushThread.start()
+
+    def _stopFlushThread(self) -> None:
+        """Stop the flush thread, then push the frame it had queued."""
+        if self._flushThread is None:
+            return
+        self._flushStop.set()
+        self._flushRequest.set()  # Wake the thread if it is idle
+        self._flushThread.join()
+        self._flushThread = None
+        self._flushStop.clear()
+        self._flushRequest.clear()
+
+        with self._flushDone:
+            self._flushing[:] = self._queuedFrame
+            sequence = self._queuedSequence
+            force, self._flushForce = self._flushForce, False
+        if sequence != self._flushedSequence:
+            with self._lock:
+                self._show(self._flushing, force)
+        self._finishFlush(sequence)
+
+    def _runFlush(self, period: float) -> None:
+        """Push queued frames at most once per period (flush thread).
+
+        Args:
+            period: Minimum time between pushes in seconds (0 for no limit).
+        """
+        request, stop = self._flushRequest, self._flushStop
+        nextFlush = time.monotonic()
+        while True:
+            request.wait()
+            if stop.is_set():
+                return
+            # Frames queued until the next tick replace each other
+            if stop.wait(nextFlush - time.monotonic()):
+                return
+            request.clear()
+            with self._flushDone:
+                self._flushing[:] = self._queuedFrame
+                sequence = self._queuedSequence
+                force, self._flushForce = self._flushForce, False
+            nextFlush = time.monotonic() + period
+            with self._lock:
+                self._show(self._flushing, force)
+            self._finishFlush(sequence)
+
+    def _finishFlush(self, sequence: int) -> None:
+        """Mark queued frames up to sequence as pushed and wake flush() callers.
+
+        Args:
+            sequence: Queue sequence number of the pushed frame.
+        """
+        with self._flushDone:
+            self._flushedSequence = sequence
+            self._flushDone.notify_all()
+
+    def update(self, force: bool = False) -> None:
+        """Push the current framebuffer to the LED matrix.
+
+        A frame published with swap() is taken over into the framebuffer
+        first. The transfer is skipped if the framebuffer equals the last
+        pushed frame and no output setting (brightness, gamma, fade level,
+        transform) changed.
+
+        With async flushing or a frame rate limit (see setAsyncFlush() and
+        setMaxFps()) the frame is only queued for the flush thread and this
+        call does not block.
+
+        Args:
+            force: Push the frame even if it did not change and rewrite the
+                whole strip buffer (default False).
+        """
+        if self._flushThread is not None:
+            self._enqueue(force)
+            return
+        with self._lock:
+            self._takeFrame()
+            self._show(self._pixels, force)
+
+    def flush(self, wait: bool = True) -> None:
+        """Push the current framebuffer, optionally waiting for the transfer.
+
+        Without a flush thread this is the same as update(). With one, the
+        frame is queued like update() does, and with wait the call returns
+        only after the flush thread pushed this frame (or a newer one).
+
+        Args:
+            wait: Block until the frame is on the LEDs (default True).
+        """
+        if self._flushThread is None:
+            self.update()
+            return
+        sequence = self._enqueue(False)
+        if wait:
+            with self._flushDone:
+                self._flushDone.wait_for(lambda: self._flushedSequence >= sequence)
+
+    def _enqueue(self, force: bool) -> int:
+        """Queue the framebuffer for the flush thread, replacing older frames.
+
+        Args:
+            force: Push the frame even if unchanged.
+
+        Returns:
+            Queue sequence number of the frame.
+        """
+        with self._flushDone:
+            self._takeFrame()
+            self._queuedFrame[:] = self._pixels
+            self._queuedSequence += 1
+            if force:
+                self._flushForce = True
+            sequence = self._queuedSequence
+        self._flushRequest.set()
+        return sequence
+
+    def _takeFrame(self) -> None:
+        """Take over a frame published with swap() and expand palette indices."""
+        if self._framePublished:
+            with self._swapLock:
+                self.frame[:] = self._pendingFrame
+                self._framePublished = False
+        if self._indexed:
+            np.take(self.palette, self._indices, axis=0, out=self._pixels)
+
+    def _show(self, pixels: np.ndarray, force: bool = False) -> None:
+        """Push pixels to the strip now; the caller holds _lock (see update()).
+
+        Args:
+            pixels: (64, 3) frame to show.
+            force: Push even if unchanged and rewrite the whole strip buffer.
+        """
+        stats = self._stats
+        if stats is not None:
+            start = time.perf_counter_ns()
+        if not (force or self._forceShow) and np.array_equal(pixels, self._shown):
+            self._framesSkipped += 1
+            return
+
+        self._shown[:] = pixels
+        self._forceShow = False
+        self._writer.write(self._renderOutput(pixels), force)
+        if stats is None:
+            self.matrix.show()
+        else:
+            flushStart = time.perf_counter_ns()
+            self.matrix.show()
+            stats.record(start, flushStart, time.perf_counter_ns())
+        self._framesSent += 1
+
+    def setStatsEnabled(self, enabled: bool) -> None:
+        """Enable or disable frame timing counters.
+
+        Enabling starts with fresh counters. While disabled, update() does
+        not take any timestamps.
+
+        Args:
+            enabled: True to collect timing counters, False to stop.
+        """
+        self._stats = _FrameStats() if enabled else None
+
+    def stats(self) -> Optional[Dict[str, Any]]:
+        """Get a snapshot of the frame timing counters.
+
+        The snapshot contains the pushed frames, the reached frames per
+        second, the jitter (standard deviation) of the time between frames,
+        the mean time spent rendering (swap, palette, output stage, packing)
+        and flushing (PixelStrip.show()), and a histogram of the show()
+        latency. Times are in milliseconds.
+
+        Returns:
+            Dictionary of counters, or None if counters are disabled.
+        """
+        stats = self._stats
+        return None if stats is None else stats.snapshot()
+
+    def getFrameCounts(self) -> Tuple[int, int]:
+        """Get how many frames were pushed and how many were skipped.
+
+        Returns:
+            Tuple of (sent, skipped) frame counts since initialization.
+        """
+        return self._framesSent, self._framesSkipped
+
+    def _runFrames(
+        self,
+        frames: Iterable[np.ndarray],
+        delay: float,
+        stopEvent: threading.Event,
+        skipLate: bool = True,
+    ) -> None:
+        """Show frames at a fixed rate until done or stopped.
+
+        Frame n is due at start + n * delay (monotonic clock), so render and
+        transfer time do not add up. Every slot that passes without a frame
+        being shown counts as a dropped frame.
+
+        Args:
+            frames: Iterable of (8, 8, 3) frames.
+            delay: Time per frame in seconds.
+            stopEvent: Event that cancels playback when set.
+            skipLate: Skip frames whose slot has passed to catch up (for
+                pre-rendered frames). If False, late frames are shown right
+                away and the missed slots are skipped instead (default True).
+        """
+        period = int(delay * 1_000_000_000)
+        deadline = time.monotonic_ns()
+        frame = self.frame
+
+        for nextFrame in frames:
+            now = time.monotonic_ns()
+            missed = (now - deadline) // period if period else 0
+            if missed > 0:
+                if skipLate:
+                    self._droppedFrames += 1
+                    deadline += period
+                    continue
+                self._droppedFrames += missed
+                deadline += missed * period
+            elif now < deadline and stopEvent.wait((deadline - now) / 1e9):
+                return
+
+            if stopEvent.is_set():
+                return
+            frame[:] = nextFrame
+            self.update()
+            deadline += period
+
+        # Hold the last frame for its full slot
+        now = time.monotonic_ns()
+        if now < deadline:
+            stopEvent.wait((deadline - now) / 1e9)
+
+    @staticmethod
+    def _loopFrames(frames: np.ndarray, loops: int) -> Iterator[np.ndarray]:
+        """Yield the frames of a sequence for the given number of loops.
+
+        Args:
+            frames: Frames as (n, 8, 8, 3) array.
+            loops: Number of repetitions, 0 for infinite.
+
+        Yields:
+            One (8, 8, 3) frame at a time.
+        """
+        loopCount = 0
+        while len(frames) and (loops == 0 or loopCount < loops):
+            yield from frames
+            loopCount += 1
+
+    def play(self, frames, delay: float = 0.1, loops: int = 1) -> None:
+        """Play a frame sequence in a background thread.
+
+        Any animation that is already playing is stopped and replaced.
+        Frames are scheduled against absolute deadlines. Pre-rendered frames
+        that cannot be shown in time are skipped; an iterator that yields
+        too slowly is shown as fast as it yields. Both count as dropped
+        frames (see getDroppedFrames()).
+
+        Args:
+            frames: Array-like of shape (n, 8, 8, 3) or (n, 64, 3), or an
+                iterator yielding (8, 8, 3) frames (loops is ignored).
+            delay: Time per frame in seconds (default 0.1).
+            loops: Number of repetitions, 0 for infinite (default 1).
+
+        Raises:
+            ValueError: If the frames have the wrong shape.
+        """
+        preRendered = not isinstance(frames, Iterator)
+        if preRendered:
+            frames = self._loopFrames(self._validateFrames(frames), loops)
+
+        self.stopAnimation()
+        stopEvent = threading.Event()
+        self._animationStop = stopEvent
+        self._animationThread = threading.Thread(
+            target=self._runFrames,
+            args=(frames, delay, stopEvent, preRendered),
+            daemon=True,
+        )
+        self._animationThread.start()
+
+    def stopAnimation(self) -> None:
+        """Stop the background animation, if any, and wait for it to end.
+
+        The last shown frame stays on the matrix.
+        """
+        if self._animationStop is not None:
+            self._animationStop.set()
+        thread = self._animationThread
+        if (
+            thread is not None
+            and thread is not threading.current_thread()
+            and thread.is_alive()
+        ):
+            thread.join()
+
+    def isAnimating(self) -> bool:
+        """Check if a background animation is playing.
+
+        Returns:
+            True if an animation thread is running, False otherwise.
+        """
+        return self._animationThread is not None and self._animationThread.is_alive()
+
+    def getDroppedFrames(self) -> int:
+        """Get the number of frames dropped because their deadline had passed.
+
+        Returns:
+            Dropped frame count since initialization.
+        """
+        return self._droppedFrames
 
     @staticmethod
     def _xyToIndex(x: int, y: int) -> int:
@@ -326,20 +1406,59 @@ class LedMatrix:
         """
         return FONT_5X7.get(char, FONT_5X7[" "])
 
-    def _textToBitmap(self, text: str) -> List[int]:
-        """Convert a text string to a contiguous bitmap.
+    @staticmethod
+    def _getCharMask(char: str) -> int:
+        """Get the compiled pixel mask for a character.
+
+        Args:
+            char: Single character to look up.
+
+        Returns:
+            64-bit pixel mask with the glyph at x = 0.
+        """
+        return FONT_MASKS.get(char, 0)
+
+    @staticmethod
+    def _textToBitmap(text: str) -> List[int]:
+        """Convert a text string to a contiguous proportional bitmap.
 
         Args:
             text: Text string to convert.
 
         Returns:
-            List of column bytes representing the text.
+            List of column bytes representing the text (see layoutText()).
         """
-        bitmap: List[int] = []
-        for char in text:
-            bitmap.extend(self._getCharBitmap(char))
-            bitmap.append(0x00)  # Space between characters
-        return bitmap
+        return list(layoutText(text))
+
+    @staticmethod
+    def _bitmapToMask(bitmap: List[int]) -> np.ndarray:
+        """Expand column bytes into a boolean pixel mask.
+
+        Only the 7 font rows are used; the bottom row stays unlit.
+
+        Args:
+            bitmap: List of column bytes (bit y set = pixel lit in row y).
+
+        Returns:
+            Boolean array of shape (8, len(bitmap)), indexed [y, x].
+        """
+        columns = np.asarray(bitmap, dtype=np.uint8)
+        mask = np.zeros((MATRIX_HEIGHT, len(bitmap)), dtype=bool)
+        mask[:7] = (columns >> np.arange(7, dtype=np.uint8)[:, None]) & 1
+        return mask
+
+    @staticmethod
+    def _maskToBits(mask: int) -> np.ndarray:
+        """Expand a 64-bit pixel mask into a boolean array in strip order.
+
+        Args:
+            mask: 64-bit pixel mask.
+
+        Returns:
+            Boolean array of shape (64,).
+        """
+        packed = np.array([mask & FULL_MASK], dtype="<u8").view(np.uint8)
+        return np.unpackbits(packed, bitorder="little").view(bool)
 
     def scrollText(
         self,
@@ -348,44 +1467,74 @@ class LedMatrix:
         delay: float = 0.1,
         loops: int = 1,
         background: ColorTuple = (0, 0, 0),
+        block: bool = True,
     ) -> None:
         """Scroll text from right to left across the 8x8 LED matrix.
 
+        The frames are rendered once per (text, color, background) and kept
+        in an LRU cache, so repeated loops and calls only push ready frames.
+
         Args:
             text: Text to display.
             color: Text color as (R, G, B) tuple.
             delay: Delay between frames in seconds (default 0.1).
             loops: Number of repetitions, 0 for infinite (default 1).
             background: Background color as (R, G, B) tuple (default (0, 0, 0)).
+            block: If False, scroll in the background via play() (default True).
         """
-        r, g, b = self._validateColor(color)
-        bgR, bgG, bgB = self._validateColor(background)
+        frames = _renderScrollFrames(
+            text,
+            tuple(self._validateColor(color)),
+            tuple(self._validateColor(background)),
+        )
 
-        # Convert text to bitmap with padding
-        bitmap = [0x00] * 8 + self._textToBitmap(text) + [0x00] * 8
-        totalWidth = len(bitmap)
-        loopCount = 0
+        if not block:
+            self.play(frames, delay, loops)
+            return
+
+        self.stopAnimation()
+        self._runFrames(self._loopFrames(frames, loops), delay, threading.Event())
 
-        # Pre-compute xy to index mapping for the 8x7 display area
-        xyToIdx = [(x, y, (y << 3) + x) for x in range(8) for y in range(7)]
+    def transition(
+        self,
+        frame,
+        kind: str = TRANSITION_CROSSFADE,
+        duration: float = 0.5,
+        steps: int = 16,
+        block: bool = False,
+    ) -> None:
+        """Change from the shown frame to a new frame with an effect.
 
-        while loops == 0 or loopCount < loops:
-            for offset in range(totalWidth - 7):
-                # Clear matrix buffer
-                for i in range(MATRIX_LED_COUNT):
-                    self.matrix.setPixelColorRGB(i, bgR, bgG, bgB)
+        The transition starts from the frame last pushed to the matrix, which
+        differs from the framebuffer in indexed mode, after swap() or after
+        drawing without update(). The intermediate frames are rendered once
+        per (from, to, kind, steps) by renderTransition() and kept in an LRU
+        cache, so switching between the same screens again only plays ready
+        frames.
 
-                # Draw current frame
-                for x, y, idx in xyToIdx:
-                    bitmapIdx = offset + x
-                    if bitmapIdx < totalWidth:
-                        if bitmap[bitmapIdx] & (1 << y):
-                            self.matrix.setPixelColorRGB(idx, r, g, b)
+        Args:
+            frame: Target frame, array-like of shape (8, 8, 3) or (64, 3).
+            kind: One of TRANSITIONS (default TRANSITION_CROSSFADE).
+            duration: Length of the transition in seconds (default 0.5).
+            steps: Number of frames, the last one is the target (default 16).
+            block: If True, wait until the transition is done; otherwise it
+                plays in the background via play() (default False).
 
-                self.matrix.show()
-                time.sleep(delay)
+        Raises:
+            ValueError: If the frame, kind or steps are invalid.
+        """
+        self.stopAnimation()  # Start from the final frame of a running one
+        with self._lock:
+            start = self._shown.copy()
+        frames = renderTransition(start, frame, kind, steps)
+        delay = duration / steps
+
+        if not block:
+            self.play(frames, delay)
+            return
 
-            loopCount += 1
+        self.stopAnimation()
+        self._runFrames(frames, delay, threading.Event())
 
     def showChar(
         self,
@@ -402,23 +1551,27 @@ class LedMatrix:
             offsetX: Horizontal offset for centering (default 1).
             background: Background color as (R, G, B) tuple (default (0, 0, 0)).
         """
-        r, g, b = self._validateColor(color)
-        bgR, bgG, bgB = self._validateColor(background)
+        self.showMask(shiftMask(self._getCharMask(char), offsetX), color, background)
 
-        # Set background
-        for i in range(MATRIX_LED_COUNT):
-            self.matrix.setPixelColorRGB(i, bgR, bgG, bgB)
+    def showMask(
+        self, mask: int, color: ColorTuple, background: ColorTuple = (0, 0, 0)
+    ) -> None:
+        """Display a monochrome 64-bit pixel mask on the matrix.
 
-        # Draw character
-        charBitmap = self._getCharBitmap(char)
-        for colIdx, column in enumerate(charBitmap):
-            x = offsetX + colIdx
-            if 0 <= x < 8:
-                for y in range(7):
-                    if column & (1 << y):
-                        self.matrix.setPixelColorRGB((y << 3) + x, r, g, b)
+        Bit (y << 3) + x of the mask lights the pixel at x, y.
 
-        self.matrix.show()
+        Args:
+            mask: 64-bit pixel mask.
+            color: Color of set pixels as (R, G, B) tuple.
+            background: Color of unset pixels as (R, G, B) tuple (default (0, 0, 0)).
+        """
+        color = self._validateColor(color)
+        background = self._validateColor(background)
+
+        lit = self._maskToBits(mask)
+        self._pixels[:] = background
+        self._pixels[lit] = color
+        self.update()
 
     def showText(
         self,
@@ -437,3 +1590,107 @@ class LedMatrix:
         """
         if text:
             self.showChar(text[0], color, background=background)
+
+
+@lru_cache(maxsize=SCROLL_CACHE_SIZE)
+def _renderScrollFrames(
+    text: str, color: ColorTuple, background: ColorTuple
+) -> np.ndarray:
+    """Render every frame of a text scrolling across the matrix.
+
+    Args:
+        text: Text to render.
+        color: Text color as (R, G, B) tuple.
+        background: Background color as (R, G, B) tuple.
+
+    Returns:
+        Read-only uint8 array of shape (frames, 8, 8, 3).
+    """
+    # Convert text to bitmap with padding
+    bitmap = [0x00] * 8 + LedMatrix._textToBitmap(text) + [0x00] * 8
+    lit = LedMatrix._bitmapToMask(bitmap)
+
+    # Gather the 8 visible columns of every scroll offset: (frames, 8, 8)
+    offsets = np.arange(len(bitmap) - 7)[:, None] + np.arange(MATRIX_WIDTH)
+    windows = lit[:, offsets].transpose(1, 0, 2)
+
+    frames = np.where(
+        windows[..., None],
+        np.array(color, dtype=np.uint8),
+        np.array(background, dtype=np.uint8),
+    )
+    frames.setflags(write=False)
+    return frames
+
+
+# Fixed random order in which dissolve reveals the pixels: rank of every pixel
+_DISSOLVE_RANK = np.random.default_rng(0x10ED).permutation(MATRIX_LED_COUNT)
+_DISSOLVE_RANK = _DISSOLVE_RANK.reshape(MATRIX_HEIGHT, MATRIX_WIDTH)
+
+
+def renderTransition(
+    start, end, kind: str = TRANSITION_CROSSFADE, steps: int = 16
+) -> np.ndarray:
+    """Render the frames of a transition between two frames.
+
+    Args:
+        start: Frame shown before the transition, shape (8, 8, 3) or (64, 3).
+        end: Frame shown after the transition, shape (8, 8, 3) or (64, 3).
+        kind: One of TRANSITIONS (default TRANSITION_CROSSFADE).
+        steps: Number of frames, the last one equals end (default 16).
+
+    Returns:
+        Read-only uint8 array of shape (steps, 8, 8, 3), cached per
+        (start, end, kind, steps).
+
+    Raises:
+        ValueError: If a frame, the kind or steps are invalid.
+    """
+    if kind not in TRANSITIONS:
+        raise ValueError("Unknown transition")
+    if steps < 1:
+        raise ValueError("Steps must be at least 1")
+    start = np.ascontiguousarray(LedMatrix._validateFrame(start), dtype=np.uint8)
+    end = np.ascontiguousarray(LedMatrix._validateFrame(end), dtype=np.uint8)
+    return _renderTransition(start.tobytes(), end.tobytes(), kind, steps)
+
+
+@lru_cache(maxsize=TRANSITION_CACHE_SIZE)
+def _renderTransition(start: bytes, end: bytes, kind: str, steps: int) -> np.ndarray:
+    """Render the frames of a transition (see renderTransition()).
+
+    Args:
+        start: Raw bytes of the (8, 8, 3) uint8 start frame.
+        end: Raw bytes of the (8, 8, 3) uint8 end frame.
+        kind: One of TRANSITIONS.
+        steps: Number of frames.
+
+    Returns:
+        Read-only uint8 array of shape (steps, 8, 8, 3).
+    """
+    shape = (MATRIX_HEIGHT, MATRIX_WIDTH, 3)
+    a = np.frombuffer(start, dtype=np.uint8).reshape(shape)
+    b = np.frombuffer(end, dtype=np.uint8).reshape(shape)
+    step = np.arange(1, steps + 1)  # Step k of steps, the last frame is the target
+
+    if kind == TRANSITION_CROSSFADE:
+        weight = step[:, None, None, None].astype(np.uint32)
+        frames = (a * (steps - weight) + b * weight + steps // 2) // steps
+    elif kind == TRANSITION_SLIDE:
+        # Window of 8 columns moving over [start | end]
+        strip = np.concatenate((a, b), axis=1)  # (8, 16, 3)
+        offsets = (step * MATRIX_WIDTH + steps // 2) // steps
+        windows = offsets[:, None] + np.arange(MATRIX_WIDTH)
+        frames = strip[:, windows].transpose(1, 0, 2, 3)
+    else:
+        if kind == TRANSITION_WIPE:
+            order, count = np.arange(MATRIX_WIDTH)[None, :], MATRIX_WIDTH
+        else:
+            order, count = _DISSOLVE_RANK, MATRIX_LED_COUNT
+        # Pixels whose rank is below the revealed count of a step show the target
+        revealed = (step * count + steps // 2) // steps
+        frames = np.where((order < revealed[:, None, None])[..., None], b, a)
+
+    frames = np.ascontiguousarray(frames, dtype=np.uint8)
+    frames.setflags(write=False)
+    return frames
@@ -0,0 +1,245 @@
+import fcntl
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator, Optional, Set
+
+import numpy as np
+
+from .LedMatrix import MATRIX_HEIGHT, MATRIX_LED_COUNT, MATRIX_WIDTH, LedMatrix
+
+if TYPE_CHECKING:
+    from multiprocessing import shared_memory  # Python 3.8+
+
+# Default name of the shared memory block (/dev/shm/joypi_ledmatrix)
+SHARED_FRAME_NAME: str = "joypi_ledmatrix"
+
+# Layout: uint32 sequence counter, then 192 bytes RGB (8, 8, 3)
+_SEQUENCE_SIZE = 4
+_FRAME_SIZE = MATRIX_LED_COUNT * 3
+_READ_RETRIES = 100
+
+# Blocks created by this process; their resource tracker entry must stay
+_createdNames: Set[str] = set()
+
+
+def _shmPath(name: str) -> str:
+    """Get the /dev/shm file backing a shared memory block."""
+    return os.path.join("/dev/shm", name.lstrip("/"))
+
+
+def _attach(name: str) -> "shared_memory.SharedMemory":
+    """Attach to an existing block without letting this process destroy it."""
+    from multiprocessing import shared_memory
+
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        # Python < 3.13 always tracks and would unlink the block on exit
+        from multiprocessing import resource_tracker
+
+        shm = shared_memory.SharedMemory(name)
+        # Registrations are per name, so keep the one of a creator in this
+        # process, it unlinks the block itself
+        if shm.name not in _createdNames:
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+class SharedLedFrame:
+    """LED matrix framebuffer in shared memory for multi-process rendering.
+
+    The process that owns the LedMatrix (usually running as root) creates
+    the block and flushes new frames with show() or watch(). Any number of
+    unprivileged processes attach by name and draw into it without copies
+    or messages. A sequence counter (odd while a write is in progress)
+    tells the owner when a new, complete frame is available. Writers are
+    serialized with a lock on the /dev/shm file, so producers in several
+    processes never interleave their counter updates. Needs Python 3.8+.
+
+    Attributes:
+        frame: The shared frame as (8, 8, 3) uint8 array.
+    """
+
+    __slots__ = (
+        "frame",
+        "_shm",
+        "_sequence",
+        "_created",
+        "_lastShown",
+        "_pending",
+        "_lockFile",
+        "_writeLock",
+    )
+
+    def __init__(
+        self, name: str = SHARED_FRAME_NAME, create: bool = False, mode: int = 0o666
+    ):
+        """Create or attach to a shared frame.
+
+        Args:
+            name: Name of the shared memory block (default "joypi_ledmatrix").
+            create: True to create the block (LedMatrix owner), False to
+                attach to an existing one (producers) (default False).
+            mode: File permissions of a created block, so unprivileged
+                producers can open it (default 0o666).
+
+        Raises:
+            FileExistsError: If create is True and the block already exists.
+            FileNotFoundError: If create is False and the block does not exist.
+        """
+        if create:
+            # Imported here, importing the package must work on Python 3.7
+            from multiprocessing import shared_memory
+
+            self._shm = shared_memory.SharedMemory(
+                name, create=True, size=_SEQUENCE_SIZE + _FRAME_SIZE
+            )
+            os.chmod(_shmPath(self._shm.name), mode)
+            _createdNames.add(self._shm.name)
+        else:
+            self._shm = _attach(name)
+
+        self._created = create
+        # flock() excludes other processes, the thread lock other threads
+        # sharing this instance (they share one open file description)
+        self._lockFile = os.open(_shmPath(self._shm.name), os.O_RDWR)
+        self._writeLock = threading.Lock()
+        buffer = self._shm.buf
+        self._sequence = np.ndarray((1,), dtype=np.uint32, buffer=buffer)
+        self.frame = np.ndarray(
+            (MATRIX_HEIGHT, MATRIX_WIDTH, 3),
+            dtype=np.uint8,
+            buffer=buffer,
+            offset=_SEQUENCE_SIZE,
+        )
+        self._lastShown = -1
+        self._pending = np.zeros_like(self.frame)
+
+    def getSequence(self) -> int:
+        """Get the number of frames written so far.
+
+        Returns:
+            Frame count (wraps around at 2**31).
+        """
+        return int(self._sequence[0]) >> 1
+
+    @contextmanager
+    def drawing(self) -> Iterator[np.ndarray]:
+        """Draw directly into the shared frame.
+
+        The frame is marked as being written while the block runs, so the
+        owner never shows a half-drawn frame. Other writers, in this or
+        another process, wait until the block ends.
+
+        Yields:
+            The shared (8, 8, 3) frame array.
+        """
+        sequence = self._sequence
+        with self._writeLock:
+            fcntl.flock(self._lockFile, fcntl.LOCK_EX)
+            try:
+                sequence[0] += 1  # odd: write in progress
+                try:
+                    yield self.frame
+                finally:
+                    sequence[0] += 1  # even: frame complete
+            finally:
+                fcntl.flock(self._lockFile, fcntl.LOCK_UN)
+
+    def write(self, frame) -> None:
+        """Copy a full frame into the shared frame.
+
+        Args:
+            frame: Frame of shape (8, 8, 3) or (64, 3).
+
+        Raises:
+            ValueError: If the frame has the wrong shape.
+        """
+        frame = LedMatrix._validateFrame(frame)
+        with self.drawing() as shared:
+            shared[:] = frame
+
+    def read(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """Get a consistent copy of the shared frame.
+
+        Args:
+            out: (8, 8, 3) uint8 array to copy into (default new array).
+
+        Returns:
+            The copied frame, or None if no complete frame could be read
+            because writers kept changing it.
+        """
+        if out is None:
+            out = np.empty_like(self.frame)
+        return out if self._readInto(out) is not None else None
+
+    def _readInto(self, out: np.ndarray) -> Optional[int]:
+        """Copy a complete frame into out (see read()).
+
+        Args:
+            out: (8, 8, 3) uint8 array to copy into.
+
+        Returns:
+            The sequence counter of the copied frame, or None on failure.
+        """
+        sequence = self._sequence
+        for _ in range(_READ_RETRIES):
+            before = int(sequence[0])
+            if before & 1:
+                time.sleep(0)
+                continue
+            out[:] = self.frame
+            if int(sequence[0]) == before:
+                return before
+        return None
+
+    def show(self, led: LedMatrix) -> bool:
+        """Show the shared frame on an LedMatrix if a new one was written.
+
+        Args:
+            led: LedMatrix to show the frame on.
+
+        Returns:
+            True if a new frame was shown, False otherwise.
+        """
+        sequence = int(self._sequence[0])
+        if sequence == self._lastShown or sequence & 1:
+            return False
+        sequence = self._readInto(self._pending)
+        if sequence is None:
+            return False
+        self._lastShown = sequence  # The frame read, writers may have moved on
+        led.showFrame(self._pending)
+        return True
+
+    def watch(
+        self,
+        led: LedMatrix,
+        interval: float = 0.01,
+        stopEvent: Optional[threading.Event] = None,
+    ) -> None:
+        """Keep showing new shared frames until stopped.
+
+        Args:
+            led: LedMatrix to show frames on.
+            interval: Time between checks in seconds (default 0.01).
+            stopEvent: Event that ends the loop when set (default None = forever).
+        """
+        if stopEvent is None:
+            stopEvent = threading.Event()
+        while not stopEvent.is_set():
+            self.show(led)
+            stopEvent.wait(interval)
+
+    def close(self) -> None:
+        """Detach from the shared frame; the creator also removes it."""
+        # Drop the array views first, the block cannot close while exported
+        self.frame = None
+        self._sequence = None
+        os.close(self._lockFile)
+        self._shm.close()
+        if self._created:
+            self._shm.unlink()
+            _createdNames.discard(self._shm.name)
@@ -0,0 +1,235 @@
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .LedMatrix import MATRIX_HEIGHT, MATRIX_WIDTH, ColorTuple, LedMatrix
+
+Placement = Tuple[np.ndarray, np.ndarray]  # (matrix pixel indices, atlas indices)
+
+_EMPTY = np.zeros(0, dtype=np.intp)
+_EMPTY.setflags(write=False)
+
+
+class Sprite:
+    """A sprite stored in a SpriteAtlas.
+
+    Only the opaque pixels are kept. For every position the sprite is
+    drawn at, the matrix pixels it covers (clipped at the edges) and the
+    matching atlas colors are computed once as two index arrays, so
+    LedMatrix.blit() is a single array assignment.
+
+    Attributes:
+        name: Name of the sprite in the atlas.
+        width: Width in pixels.
+        height: Height in pixels.
+        atlas: The SpriteAtlas holding the colors.
+    """
+
+    __slots__ = (
+        "name",
+        "width",
+        "height",
+        "atlas",
+        "_x",
+        "_y",
+        "_source",
+        "_placements",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        atlas: "SpriteAtlas",
+        xs: np.ndarray,
+        ys: np.ndarray,
+        start: int,
+        size: Tuple[int, int],
+    ):
+        """Initialize the sprite (use SpriteAtlas.add()).
+
+        Args:
+            name: Name of the sprite.
+            atlas: Atlas holding the colors.
+            xs: Column of every opaque pixel.
+            ys: Row of every opaque pixel.
+            start: Atlas index of the first opaque pixel.
+            size: (width, height) in pixels.
+        """
+        self.name = name
+        self.atlas = atlas
+        self.width, self.height = size
+        self._x = xs
+        self._y = ys
+        self._source = np.arange(start, start + len(xs))
+        self._placements: Dict[Tuple[int, int], Placement] = {}
+
+    def placement(self, x: int, y: int) -> Placement:
+        """Get the index arrays for drawing the sprite at x, y.
+
+        Args:
+            x: Matrix column of the left sprite edge (may be off the matrix).
+            y: Matrix row of the top sprite edge (may be off the matrix).
+
+        Returns:
+            Tuple of (matrix pixel indices, atlas color indices).
+        """
+        if not (-self.width < x < MATRIX_WIDTH and -self.height < y < MATRIX_HEIGHT):
+            return _EMPTY, _EMPTY  # Completely off the matrix
+
+        key = (x, y)
+        placement = self._placements.get(key)
+        if placement is None:
+            xs, ys = self._x + x, self._y + y
+            visible = (xs >= 0) & (xs < MATRIX_WIDTH) & (ys >= 0) & (ys < MATRIX_HEIGHT)
+            target = (ys[visible] << 3) + xs[visible]
+            source = self._source[visible]
+            target.setflags(write=False)
+            source.setflags(write=False)
+            placement = self._placements[key] = (target, source)
+        return placement
+
+
+class SpriteAtlas:
+    """Collection of sprites whose colors are packed into one array.
+
+    Attributes:
+        colors: Colors of all opaque sprite pixels as (n, 3) uint8 array.
+    """
+
+    __slots__ = ("colors", "_sprites")
+
+    def __init__(self):
+        """Initialize an empty atlas."""
+        self.colors = np.zeros((0, 3), dtype=np.uint8)
+        self._sprites: Dict[str, Sprite] = {}
+
+    def __getitem__(self, name: str) -> Sprite:
+        return self._sprites[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._sprites
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def add(
+        self,
+        name: str,
+        pixels,
+        transparent: Optional[ColorTuple] = (0, 0, 0),
+    ) -> Sprite:
+        """Add a sprite from an RGB image.
+
+        Args:
+            name: Name of the sprite (replaces a sprite with the same name).
+            pixels: Array-like of shape (height, width, 3).
+            transparent: Color that is not drawn, None to draw every
+                pixel (default (0, 0, 0)).
+
+        Returns:
+            The new Sprite.
+
+        Raises:
+            ValueError: If the pixels do not have shape (height, width, 3).
+        """
+        pixels = np.asarray(pixels, dtype=np.uint8)
+        if pixels.ndim != 3 or pixels.shape[2] != 3:
+            raise ValueError("Sprite pixels must have shape (height, width, 3)")
+        height, width = pixels.shape[:2]
+
+        if transparent is None:
+            opaque = np.ones((height, width), dtype=bool)
+        else:
+            key = np.asarray(LedMatrix._validateColor(transparent), dtype=np.uint8)
+            opaque = (pixels != key).any(axis=2)
+        return self._store(name, pixels, opaque)
+
+    def _store(self, name: str, pixels: np.ndarray, opaque: np.ndarray) -> Sprite:
+        """Append the opaque pixels of a sprite to the packed colors.
+
+        Args:
+            name: Name of the sprite.
+            pixels: (height, width, 3) uint8 sprite colors.
+            opaque: (height, width) boolean mask of the drawn pixels.
+
+        Returns:
+            The new Sprite.
+        """
+        ys, xs = np.nonzero(opaque)
+        start = len(self.colors)
+        self.colors = np.concatenate((self.colors, pixels[ys, xs]))
+        height, width = opaque.shape
+        sprite = Sprite(name, self, xs, ys, start, (width, height))
+        self._sprites[name] = sprite
+        return sprite
+
+    def addPattern(
+        self, name: str, rows: Sequence[str], colors: Mapping[str, ColorTuple]
+    ) -> Sprite:
+        """Add a sprite drawn as text, one character per pixel.
+
+        Characters missing from colors (e.g. "." or " ") are transparent.
+
+        Args:
+            name: Name of the sprite.
+            rows: Rows of the sprite, all of the same length.
+            colors: Color of every drawn character, e.g. {"#": (255, 0, 0)}.
+
+        Returns:
+            The new Sprite.
+
+        Raises:
+            ValueError: If the rows have different lengths.
+        """
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError("All pattern rows must have the same length")
+
+        pixels = np.zeros((len(rows), width, 3), dtype=np.uint8)
+        opaque = np.zeros((len(rows), width), dtype=bool)
+        for char, color in colors.items():
+            hit = np.array([[c == char for c in row] for row in rows], dtype=bool)
+            pixels[hit] = LedMatrix._validateColor(color)
+            opaque |= hit
+        return self._store(name, pixels, opaque)
+
+    @classmethod
+    def fromSheet(
+        cls,
+        sheet,
+        spriteWidth: int,
+        spriteHeight: int,
+        names: Sequence[str],
+        transparent: Optional[ColorTuple] = (0, 0, 0),
+    ) -> "SpriteAtlas":
+        """Create an atlas by cutting a sprite sheet into equal cells.
+
+        Cells are taken row by row, one per name.
+
+        Args:
+            sheet: Array-like of shape (height, width, 3).
+            spriteWidth: Width of one cell in pixels.
+            spriteHeight: Height of one cell in pixels.
+            names: Name of every cell in reading order.
+            transparent: Color that is not drawn, None to draw every
+                pixel (default (0, 0, 0)).
+
+        Returns:
+            The new SpriteAtlas.
+
+        Raises:
+            ValueError: If the sheet has fewer cells than names.
+        """
+        sheet = np.asarray(sheet, dtype=np.uint8)
+        columns = sheet.shape[1] // spriteWidth
+        if columns == 0 or len(names) > columns * (sheet.shape[0] // spriteHeight):
+            raise ValueError("Sprite sheet has fewer cells than names")
+
+        atlas = cls()
+        for i, name in enumerate(names):
+            row, column = divmod(i, columns)
+            y, x = row * spriteHeight, column * spriteWidth
+            atlas.add(
+                name, sheet[y : y + spriteHeight, x : x + spriteWidth], transparent
+            )
+        return atlas
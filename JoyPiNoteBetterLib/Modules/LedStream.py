@@ -0,0 +1,238 @@
+import struct
+from typing import Optional
+
+import numpy as np
+
+from .LedMatrix import MATRIX_HEIGHT, MATRIX_LED_COUNT, MATRIX_WIDTH, LedMatrix
+
+# Message layout: type (uint8), sequence number (uint16), then
+#   MESSAGE_KEYFRAME: 192 bytes RGB in strip order
+#   MESSAGE_DELTA:    uint8 n, then n * (index, r, g, b) changed pixels
+MESSAGE_KEYFRAME: int = 0x4B  # "K"
+MESSAGE_DELTA: int = 0x44  # "D"
+
+_HEADER = struct.Struct("<BH")
+_FRAME_SIZE = MATRIX_LED_COUNT * 3
+_DELTA_LIMIT = (_FRAME_SIZE - 1) // 4  # Above this a keyframe is smaller
+
+
+class FrameEncoder:
+    """Encode frames into keyframe and delta messages for streaming.
+
+    A delta message only contains the pixels that changed since the last
+    encoded frame. A keyframe is sent first, every keyframeInterval frames
+    and whenever it would be smaller than the delta.
+
+    Attributes:
+        keyframeInterval: Frames between forced keyframes, 0 to disable.
+    """
+
+    __slots__ = ("keyframeInterval", "_previous", "_sequence", "_sinceKeyframe")
+
+    def __init__(self, keyframeInterval: int = 100):
+        """Initialize the encoder.
+
+        Args:
+            keyframeInterval: Frames between forced keyframes, 0 to only
+                send them when requested (default 100).
+        """
+        self.keyframeInterval = keyframeInterval
+        self._previous = np.zeros((MATRIX_LED_COUNT, 3), dtype=np.uint8)
+        self._sequence = 0
+        self._sinceKeyframe: Optional[int] = None  # None = keyframe pending
+
+    def requestKeyframe(self) -> None:
+        """Send the next frame as keyframe, e.g. when a receiver reconnects."""
+        self._sinceKeyframe = None
+
+    def encode(self, frame) -> bytes:
+        """Encode a frame into a message.
+
+        Args:
+            frame: Frame of shape (8, 8, 3) or (64, 3).
+
+        Returns:
+            The message bytes.
+
+        Raises:
+            ValueError: If the frame has the wrong shape.
+        """
+        pixels = (
+            LedMatrix._validateFrame(frame)
+            .astype(np.uint8, copy=False)
+            .reshape(MATRIX_LED_COUNT, 3)
+        )
+        sequence = self._sequence
+        self._sequence = (sequence + 1) & 0xFFFF
+
+        changed = np.flatnonzero((pixels != self._previous).any(axis=1))
+        self._previous[:] = pixels
+
+        since = self._sinceKeyframe
+        if (
+            since is None
+            or len(changed) > _DELTA_LIMIT
+            or (self.keyframeInterval and since + 1 >= self.keyframeInterval)
+        ):
+            self._sinceKeyframe = 0
+            return _HEADER.pack(MESSAGE_KEYFRAME, sequence) + pixels.tobytes()
+
+        self._sinceKeyframe = since + 1
+        records = np.empty((len(changed), 4), dtype=np.uint8)
+        records[:, 0] = changed
+        records[:, 1:] = pixels[changed]
+        return (
+            _HEADER.pack(MESSAGE_DELTA, sequence)
+            + bytes((len(changed),))
+            + records.tobytes()
+        )
+
+
+class FrameDecoder:
+    """Decode keyframe and delta messages, optionally onto an LedMatrix.
+
+    With an LedMatrix the messages are applied straight to its framebuffer
+    and only the changed pixels are written to the strip. Deltas received
+    after a lost message are ignored until the next keyframe.
+
+    Attributes:
+        led: LedMatrix the frames are shown on, or None.
+        frame: The decoded frame as (8, 8, 3) uint8 array.
+    """
+
+    __slots__ = ("led", "frame", "_pixels", "_expected", "_buffer")
+
+    def __init__(self, led: Optional[LedMatrix] = None):
+        """Initialize the decoder.
+
+        Args:
+            led: LedMatrix to show decoded frames on (default None).
+        """
+        self.led = led
+        if led is not None:
+            self.frame = led.frame
+        else:
+            self.frame = np.zeros((MATRIX_HEIGHT, MATRIX_WIDTH, 3), dtype=np.uint8)
+        self._pixels = self.frame.reshape(MATRIX_LED_COUNT, 3)
+        self._expected: Optional[int] = None  # None = waiting for keyframe
+        self._buffer = bytearray()
+
+    @staticmethod
+    def _messageSize(data, offset: int = 0) -> Optional[int]:
+        """Get the size of the message at offset.
+
+        Args:
+            data: Buffer holding at least the message header.
+            offset: Start of the message (default 0).
+
+        Returns:
+            Message size in bytes, or None if the size is not known yet.
+
+        Raises:
+            ValueError: If the message type is unknown.
+        """
+        if len(data) - offset < _HEADER.size + 1:
+            return None
+        kind = data[offset]
+        if kind == MESSAGE_KEYFRAME:
+            return _HEADER.size + _FRAME_SIZE
+        if kind == MESSAGE_DELTA:
+            return _HEADER.size + 1 + data[offset + _HEADER.size] * 4
+        raise ValueError("Unknown message type")
+
+    def _apply(self, message: memoryview) -> bool:
+        """Apply one complete message to the frame.
+
+        Args:
+            message: The message bytes.
+
+        Returns:
+            True if applied, False if it was skipped (out of sync).
+
+        Raises:
+            ValueError: If a delta record has a pixel index out of range.
+        """
+        kind, sequence = _HEADER.unpack_from(message)
+        if kind == MESSAGE_KEYFRAME:
+            self._pixels[:] = np.frombuffer(
+                message, np.uint8, _FRAME_SIZE, _HEADER.size
+            ).reshape(MATRIX_LED_COUNT, 3)
+        elif sequence == self._expected:
+            count = message[_HEADER.size]
+            records = np.frombuffer(message, np.uint8, count * 4, _HEADER.size + 1)
+            records = records.reshape(count, 4)
+            if count and records[:, 0].max() >= MATRIX_LED_COUNT:
+                self._expected = None  # Wait for the next keyframe
+                raise ValueError("Pixel index out of range")
+            self._pixels[records[:, 0]] = records[:, 1:]
+        else:
+            self._expected = None
+            return False
+
+        self._expected = (sequence + 1) & 0xFFFF
+        return True
+
+    def decode(self, message: bytes) -> bool:
+        """Apply a single complete message and show the result.
+
+        Args:
+            message: Message produced by FrameEncoder.encode().
+
+        Returns:
+            True if the frame was applied, False if a message was lost
+            before it and it was skipped.
+
+        Raises:
+            ValueError: If the message is malformed.
+        """
+        view = memoryview(message)
+        if self._messageSize(view) != len(view):
+            raise ValueError("Malformed message")
+        applied = self._apply(view)
+        if applied and self.led is not None:
+            self.led.update()
+        return applied
+
+    def feed(self, data: bytes) -> int:
+        """Apply all complete messages in a chunk of a byte stream.
+
+        Partial messages are buffered until the rest arrives. Only the
+        final state is shown, once per call.
+
+        Args:
+            data: Bytes received from the stream.
+
+        Returns:
+            Number of frames applied.
+
+        Raises:
+            ValueError: If the stream contains an unknown message type. The
+                buffered data is dropped and the decoder waits for the next
+                keyframe.
+        """
+        buffer = self._buffer
+        buffer += data
+        view = memoryview(buffer)
+        offset = 0
+        applied = 0
+
+        try:
+            while True:
+                size = self._messageSize(view, offset)
+                if size is None or len(view) - offset < size:
+                    break
+                applied += self._apply(view[offset : offset + size])
+                offset += size
+        except ValueError as error:
+            # Message boundaries are lost, resync at the next keyframe
+            offset = len(buffer)
+            self._expected = None
+            # Without the traceback no frame keeps a view of the buffer alive
+            raise error.with_traceback(None)
+        finally:
+            view.release()
+            del buffer[:offset]
+
+        if applied and self.led is not None:
+            self.led.update()
+        return applied
@@ -4,6 +4,15 @@ A Python library for JoyPi Note hardware components designed for Raspberry Pi.
 
 Supported Components:
     - LedMatrix: 8x8 NeoPixel LED matrix with text rendering
+    - LedCompositor: Alpha-blended RGBA layers for the LED matrix
+    - LedCanvas: Virtual canvas spanning several chained LED matrices
+    - LedAnimation: Memory-mapped animation files for the LED matrix
+    - LedEffects: Vectorized procedural effects for the LED matrix
+    - LedImage: PPM/PGM/raw image loading scaled to the LED matrix
+    - SpriteAtlas: Packed sprites for clipped blitting on the LED matrix
+    - LedStream: Delta-encoded frame streaming for the LED matrix
+    - SharedLedFrame: Shared-memory LED matrix frame for other processes
+    - LedDaemon: Socket daemon owning the LED matrix, with LedMatrixClient
     - LcdDisplay: I2C character LCD display
     - Seg7x4: 4-digit 7-segment I2C display
     - ButtonMatrix: 4x4 button matrix via MCP3008 ADC
@@ -17,7 +26,23 @@ from .Modules.Buzzer import Buzzer, PwmBuzzer
 from .Modules.HumTemp import HumidityTemperatureSensor
 from .Modules.Joystick import Direction, Joystick
 from .Modules.LcdDisplay import LcdDisplay, ScrollingLinesLcd
+from .Modules.LedAnimation import LedAnimation, writeAnimation
+from .Modules.LedCanvas import LedCanvas
+from .Modules.LedCompositor import LedCompositor
+from .Modules.LedDaemon import LedDaemon, LedMatrixClient
+from .Modules.LedEffects import (
+    FadeEffect,
+    GlintEffect,
+    PlasmaEffect,
+    RainbowEffect,
+    SparkleEffect,
+    TrailEffect,
+)
+from .Modules.LedImage import loadImage
 from .Modules.LedMatrix import LedMatrix
+from .Modules.LedSharedFrame import SharedLedFrame
+from .Modules.LedSprites import Sprite, SpriteAtlas
+from .Modules.LedStream import FrameDecoder, FrameEncoder
 from .Modules.LightSensor import LightSensor
 from .Modules.Nfc import NfcReader
 from .Modules.Relay import Relay
@@ -33,6 +58,24 @@ from .Other.Clear import ModuleReset
 
 __all__ = [
     "LedMatrix",
+    "LedCompositor",
+    "LedCanvas",
+    "LedAnimation",
+    "writeAnimation",
+    "GlintEffect",
+    "SparkleEffect",
+    "FadeEffect",
+    "RainbowEffect",
+    "PlasmaEffect",
+    "TrailEffect",
+    "loadImage",
+    "Sprite",
+    "SpriteAtlas",
+    "FrameEncoder",
+    "FrameDecoder",
+    "SharedLedFrame",
+    "LedDaemon",
+    "LedMatrixClient",
     "LcdDisplay",
     "Seg7x4",
     "ButtonMatrix",
@@ -352,6 +352,112 @@ def testLedMatrix() -> None:
         except Exception as e:
             printTest("setBrightness validation", False, str(e))
 
+        # Test setMaxFps
+        try:
+            import threading
+
+            matrix.setMaxFps(20)
+            sentBefore = matrix.getFrameCounts()[0]
+
+            def drawLoop(row: int) -> None:
+                for value in range(100):
+                    matrix.frame[row] = (0, value, 0)
+                    matrix.update()
+                    time.sleep(0.002)
+
+            threads = [threading.Thread(target=drawLoop, args=(r,)) for r in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            matrix.setMaxFps(None)
+            pushed = matrix.getFrameCounts()[0] - sentBefore
+            printTest(
+                "setMaxFps",
+                pushed < 100 and tuple(matrix.frame[3, 0]) == (0, 99, 0),
+                f"{pushed} pushes for 400 updates",
+            )
+        except Exception as e:
+            printTest("setMaxFps", False, str(e))
+
+        # Test async flush
+        try:
+            matrix.setAsyncFlush(True)
+            start = time.perf_counter()
+            for value in range(100):
+                matrix.setAll((0, 0, value))
+                matrix.update()
+            elapsed = (time.perf_counter() - start) * 1000
+            matrix.flush(wait=True)
+            shown = matrix.matrix.getPixelColor(0)
+            matrix.setAsyncFlush(False)
+            printTest(
+                "setAsyncFlush/flush",
+                shown == 99 and not matrix.isAsyncFlush(),
+                f"100 updates queued in {elapsed:.1f} ms",
+            )
+        except Exception as e:
+            printTest("setAsyncFlush/flush", False, str(e))
+
+        # Test transitions
+        try:
+            from JoyPiNoteBetterLib.Modules.LedMatrix import TRANSITIONS
+
+            matrix.clear()
+            black = [(0, 0, 0)] * 64
+            target = [(0, 0, 255) if i % 8 < 4 else (0, 0, 0) for i in range(64)]
+            for kind in TRANSITIONS:
+                matrix.transition(target, kind, duration=0.2, steps=8)
+                time.sleep(0.3)
+                matrix.transition(black, kind, duration=0.2, block=True)
+            matrix.transition(target, "wipe", duration=0.2, block=True)
+            shown = [tuple(p) for p in matrix.frame.reshape(64, 3).tolist()]
+            printTest(
+                "transition",
+                shown == target and not matrix.isAnimating(),
+                ", ".join(TRANSITIONS),
+            )
+        except Exception as e:
+            printTest("transition", False, str(e))
+
+        # Test frame timing stats
+        try:
+            matrix.setStatsEnabled(True)
+            matrix.scrollText("Hi", (0, 0, 255), delay=0.02)
+            stats = matrix.stats()
+            matrix.setStatsEnabled(False)
+            printTest(
+                "stats",
+                stats["frames"] > 0 and stats["fps"] > 0 and matrix.stats() is None,
+                f"{stats['fps']:.1f} fps, {stats['jitterMs']:.2f} ms jitter, "
+                f"{stats['flushMs']:.2f} ms show()",
+            )
+        except Exception as e:
+            printTest("stats", False, str(e))
+
+        # Test setGamma / setFadeLevel
+        try:
+            matrix.setAll((255, 255, 255))
+            matrix.setGamma(2.2)
+            for level in range(10, -1, -1):
+                matrix.setFadeLevel(level / 10)
+                matrix.update()
+                time.sleep(0.03)
+            matrix.setFadeLevel(1.0)
+            matrix.setGamma(1.0)
+            printTest("setGamma / setFadeLevel", True)
+        except Exception as e:
+            printTest("setGamma / setFadeLevel", False, str(e))
+
+        # Test setFadeLevel validation
+        try:
+            matrix.setFadeLevel(1.5)  # Should raise ValueError
+            printTest("setFadeLevel validation", False, "Should have raised ValueError")
+        except ValueError:
+            printTest("setFadeLevel validation", True, "Correctly rejected invalid value")
+        except Exception as e:
+            printTest("setFadeLevel validation", False, str(e))
+
         # Test setPixel
         try:
             matrix.setPixel(0, (255, 0, 0))
@@ -378,6 +484,24 @@ def testLedMatrix() -> None:
         except Exception as e:
             printTest("setAll", False, str(e))
 
+        # Test showFrame
+        try:
+            frame = [[(x * 32, y * 32, 0) for x in range(8)] for y in range(8)]
+            matrix.showFrame(frame)
+            time.sleep(0.3)
+            printTest("showFrame", matrix.frame[7, 7, 0] == 224)
+        except Exception as e:
+            printTest("showFrame", False, str(e))
+
+        # Test showFrame validation
+        try:
+            matrix.showFrame([(0, 0, 0)] * 10)  # Should raise ValueError
+            printTest("showFrame validation", False, "Should have raised ValueError")
+        except ValueError:
+            printTest("showFrame validation", True, "Correctly rejected invalid shape")
+        except Exception as e:
+            printTest("showFrame validation", False, str(e))
+
         # Test update
         try:
             matrix.update()
@@ -385,6 +509,18 @@ def testLedMatrix() -> None:
         except Exception as e:
             printTest("update", False, str(e))
 
+        # Test update skipping unchanged frames
+        try:
+            sent, skipped = matrix.getFrameCounts()
+            matrix.update()
+            newSent, newSkipped = matrix.getFrameCounts()
+            printTest(
+                "update skips unchanged frame",
+                newSent == sent and newSkipped == skipped + 1,
+            )
+        except Exception as e:
+            printTest("update skips unchanged frame", False, str(e))
+
         # Test clean
         try:
             matrix.clear()
@@ -400,6 +536,31 @@ def testLedMatrix() -> None:
         except Exception as e:
             printTest("showChar", False, str(e))
 
+        # Test setPowerLimit
+        try:
+            matrix.setPowerLimit(300)
+            matrix.setAll((255, 255, 255))
+            matrix.update()
+            time.sleep(0.5)
+            estimate = matrix.getPowerEstimate()
+            limited = matrix.matrix.getPixelColor(0) != 0xFFFFFF
+            matrix.setPowerLimit(None)
+            printTest(
+                "setPowerLimit",
+                limited and estimate > 300,
+                f"estimated {estimate:.0f} mA, limited to 300 mA",
+            )
+        except Exception as e:
+            printTest("setPowerLimit", False, str(e))
+
+        # Test showMask
+        try:
+            matrix.showMask(0xFF000000000000FF, (255, 128, 0), (0, 0, 40))
+            time.sleep(0.3)
+            printTest("showMask", tuple(matrix.frame[7, 0]) == (255, 128, 0))
+        except Exception as e:
+            printTest("showMask", False, str(e))
+
         # Test showText
         try:
             matrix.showText("Hi", (0, 255, 255))
@@ -415,6 +576,345 @@ def testLedMatrix() -> None:
         except Exception as e:
             printTest("scrollText", False, str(e))
 
+        # Test proportional text layout
+        try:
+            from JoyPiNoteBetterLib.Modules.LedMatrix import layoutText
+
+            narrow = len(layoutText("I1"))  # 3 + 1 gap + 3 columns
+            wide = len(layoutText("WW"))  # 5 + 1 gap + 5 columns
+            kerned = len(layoutText("To"))  # "o" fits under the "T" bar, no gap
+            printTest(
+                "layoutText",
+                (narrow, wide, kerned, len(layoutText("TT"))) == (7, 11, 10, 11)
+                and layoutText("WW") is layoutText("WW"),
+                f"I1={narrow}, WW={wide}, To={kerned} columns",
+            )
+        except Exception as e:
+            printTest("layoutText", False, str(e))
+
+        # Test scroll frame cache
+        try:
+            from JoyPiNoteBetterLib.Modules.LedMatrix import _renderScrollFrames
+
+            _renderScrollFrames.cache_clear()
+            matrix.scrollText("Cache", (0, 255, 0), delay=0.01)
+            matrix.scrollText("Cache", (0, 255, 0), delay=0.01)
+            reused = _renderScrollFrames.cache_info()
+            matrix.scrollText("Cache", (255, 0, 0), delay=0.01)
+            recolored = _renderScrollFrames.cache_info()
+            printTest(
+                "scrollText cache",
+                (reused.hits, reused.misses) == (1, 1)
+                and (recolored.hits, recolored.misses) == (1, 2),
+                f"{recolored.hits} hits, {recolored.misses} misses",
+            )
+        except Exception as e:
+            printTest("scrollText cache", False, str(e))
+
+        # Test non-blocking scrollText / play
+        try:
+            matrix.scrollText("AB", (0, 255, 0), delay=0.05, loops=0, block=False)
+            time.sleep(0.3)
+            running = matrix.isAnimating()
+            matrix.stopAnimation()
+            printTest(
+                "scrollText(block=False)",
+                running and not matrix.isAnimating(),
+                f"{matrix.getDroppedFrames()} dropped frames",
+            )
+        except Exception as e:
+            printTest("scrollText(block=False)", False, str(e))
+
+        # Test swap
+        try:
+            matrix.backFrame[:] = (0, 40, 0)
+            matrix.swap()
+            matrix.update()
+            time.sleep(0.3)
+            printTest("swap", tuple(matrix.frame[4, 4]) == (0, 40, 0))
+        except Exception as e:
+            printTest("swap", False, str(e))
+
+        # Test setTransform
+        try:
+            from JoyPiNoteBetterLib.Modules.LedMatrix import (
+                composeTransforms,
+                rotateTransform,
+                shiftTransform,
+            )
+
+            matrix.showChar("F", (255, 255, 255))
+            for degrees in (90, 180, 270, 0):
+                matrix.setTransform(rotateTransform(degrees))
+                matrix.update()
+                time.sleep(0.2)
+            for step in range(8):
+                matrix.setTransform(
+                    composeTransforms(shiftTransform(step), rotateTransform(90))
+                )
+                matrix.update()
+                time.sleep(0.05)
+            matrix.setTransform(None)
+            printTest("setTransform", True)
+        except Exception as e:
+            printTest("setTransform", False, str(e))
+
+        # Test indexed mode
+        try:
+            matrix.setPalette([(0, 0, 0), (255, 0, 0), (0, 0, 255)])
+            matrix.setIndexedMode(True)
+            for position in range(64):
+                matrix.setPixelIndex(position, position % 3)
+            for _ in range(6):
+                matrix.rotatePalette(1, 3)
+                matrix.update()
+                time.sleep(0.1)
+            matrix.setIndexedMode(False)
+            printTest("indexed mode", tuple(matrix.frame[0, 1]) == (255, 0, 0))
+        except Exception as e:
+            printTest("indexed mode", False, str(e))
+
+        # Test LedAnimation / writeAnimation
+        try:
+            import os
+            import tempfile
+
+            from JoyPiNoteBetterLib import LedAnimation, writeAnimation
+
+            path = os.path.join(tempfile.gettempdir(), "joypi_test.jpla")
+            frames = [
+                [[(x * 32, y * 32, step * 16) for x in range(8)] for y in range(8)]
+                for step in range(16)
+            ]
+            count = writeAnimation(path, frames, fps=20)
+            animation = LedAnimation(path)
+            animation.play(matrix)
+            time.sleep(1)
+            matrix.stopAnimation()
+            animation.close()
+            os.remove(path)
+            printTest("LedAnimation", count == 16 and animation.frameCount == 16)
+        except Exception as e:
+            printTest("LedAnimation", False, str(e))
+
+        # Test effects
+        try:
+            from JoyPiNoteBetterLib import PlasmaEffect, SparkleEffect
+
+            PlasmaEffect().play(matrix, fps=100, count=100)
+            time.sleep(1.2)
+            effect = SparkleEffect((255, 255, 255), density=0.1)
+            for _ in range(50):
+                matrix.showFrame(effect.step())
+                time.sleep(0.01)
+            printTest("effects", not matrix.isAnimating())
+        except Exception as e:
+            printTest("effects", False, str(e))
+
+        # Test FrameEncoder / FrameDecoder
+        try:
+            from JoyPiNoteBetterLib import FrameDecoder, FrameEncoder
+
+            encoder = FrameEncoder()
+            decoder = FrameDecoder(matrix)
+            stream = b""
+            frame = [[(0, 0, 0)] * 8 for _ in range(8)]
+            for step in range(64):
+                frame[step >> 3][step & 7] = (0, 0, 80)
+                stream += encoder.encode(frame)
+            applied = 0
+            for offset in range(0, len(stream), 100):
+                applied += decoder.feed(stream[offset : offset + 100])
+                time.sleep(0.01)
+            printTest("FrameEncoder / FrameDecoder", applied == 64)
+        except Exception as e:
+            printTest("FrameEncoder / FrameDecoder", False, str(e))
+
+        # Test FrameDecoder recovery after corrupt data
+        try:
+            try:
+                decoder.feed(b"\xff\x00\x00\x00")
+                rejected = False
+            except ValueError:
+                rejected = True
+            frame[0][0] = (80, 0, 0)
+            encoder.requestKeyframe()
+            recovered = decoder.feed(encoder.encode(frame)) == 1
+
+            # Delta in sequence, but with pixel index 200
+            frame[0][1] = (0, 80, 0)
+            corrupt = bytearray(encoder.encode(frame))
+            corrupt[4] = 200
+            try:
+                decoder.feed(bytes(corrupt))
+                rejected = False
+            except ValueError:
+                pass
+            frame[0][2] = (0, 0, 80)
+            encoder.requestKeyframe()
+            recovered = recovered and decoder.feed(encoder.encode(frame)) == 1
+            printTest(
+                "FrameDecoder recovery",
+                rejected and recovered and tuple(matrix.frame[0, 2]) == (0, 0, 80),
+            )
+        except Exception as e:
+            printTest("FrameDecoder recovery", False, str(e))
+
+        # Test SharedLedFrame
+        try:
+            from JoyPiNoteBetterLib import SharedLedFrame
+
+            owner = SharedLedFrame("joypi_test", create=True)
+            producer = SharedLedFrame("joypi_test")
+            with producer.drawing() as frame:
+                frame[:] = (60, 0, 60)
+            shown = owner.show(matrix)
+            time.sleep(0.3)
+            producer.close()
+            owner.close()
+            printTest(
+                "SharedLedFrame", shown and tuple(matrix.frame[0, 0]) == (60, 0, 60)
+            )
+        except Exception as e:
+            printTest("SharedLedFrame", False, str(e))
+
+        # Test LedDaemon / LedMatrixClient
+        try:
+            import os
+            import threading
+
+            from JoyPiNoteBetterLib import LedDaemon, LedMatrixClient
+
+            path = "/tmp/joypi_test.sock"
+            stopEvent = threading.Event()
+            daemon = LedDaemon(matrix, path, fps=60)
+            thread = threading.Thread(target=daemon.serveForever, args=(stopEvent,))
+            thread.start()
+            time.sleep(0.1)
+            with LedMatrixClient(path) as client:
+                for value in range(0, 100, 2):
+                    client.setAll((0, value, 0))
+                    client.update()
+                time.sleep(0.3)
+            stopEvent.set()
+            thread.join()
+            printTest(
+                "LedDaemon / LedMatrixClient",
+                tuple(matrix.frame[0, 0]) == (0, 98, 0) and not os.path.exists(path),
+            )
+        except Exception as e:
+            printTest("LedDaemon / LedMatrixClient", False, str(e))
+
+        # Test LedCanvas
+        try:
+            from JoyPiNoteBetterLib import LedCanvas
+
+            matrix.setAll((0, 0, 40))
+            matrix.update()
+            canvas = LedCanvas(1, width=32, strip=matrix)
+            width = canvas.drawText("JoyPi", (255, 128, 0))
+            for x in range(width):
+                canvas.setViewport(x)
+                canvas.update()
+                time.sleep(0.03)
+            matrix.update()  # Shows the unchanged matrix frame again
+            printTest(
+                "LedCanvas",
+                canvas.getViewport() == (width - 1, 0)
+                and all(matrix.matrix.getPixelColor(i) == 40 for i in range(64)),
+            )
+        except Exception as e:
+            printTest("LedCanvas", False, str(e))
+
+        # Test loadImage
+        try:
+            import os
+            import tempfile
+
+            from JoyPiNoteBetterLib import loadImage
+
+            # 16x16 PPM: left half red, right half blue
+            header = b"P6\n# test image\n16 16\n255\n"
+            row = b"\x80\x00\x00" * 8 + b"\x00\x00\x80" * 8
+            fd, path = tempfile.mkstemp(suffix=".ppm")
+            with os.fdopen(fd, "wb") as file:
+                file.write(header + row * 16)
+            image = loadImage(path)
+            cached = loadImage(path) is image
+            matrix.showFrame(image)
+            time.sleep(0.3)
+            os.remove(path)
+            printTest(
+                "loadImage",
+                cached
+                and tuple(image[0, 0]) == (128, 0, 0)
+                and tuple(image[7, 7]) == (0, 0, 128),
+            )
+        except Exception as e:
+            printTest("loadImage", False, str(e))
+
+        # Test SpriteAtlas / blit
+        try:
+            from JoyPiNoteBetterLib import SpriteAtlas
+
+            atlas = SpriteAtlas()
+            ship = atlas.addPattern("ship", [".#.", "###"], {"#": (0, 120, 0)})
+            for x in range(-3, 9):
+                matrix.frame.fill(0)
+                matrix.blit(ship, x, 6)
+                matrix.update()
+                time.sleep(0.05)
+            matrix.blit(ship, 6, -1)
+            printTest(
+                "SpriteAtlas / blit",
+                tuple(matrix.frame[0, 7]) == (0, 120, 0)
+                and not matrix.frame[6:].any(),
+            )
+        except Exception as e:
+            printTest("SpriteAtlas / blit", False, str(e))
+
+        # Test LedBitboard
+        try:
+            from JoyPiNoteBetterLib.Modules.LedBitboard import (
+                cellBit,
+                hasPath,
+                pathLength,
+                renderBoards,
+            )
+            from JoyPiNoteBetterLib.Modules.LedMatrix import FULL_MASK
+
+            walls = (0xFE << 8) | (0x7F << 24)  # Rows 1 and 3 with one gap each
+            free = FULL_MASK ^ walls
+            start, goal = cellBit(0, 0), cellBit(7, 7)
+            renderBoards(matrix, [(walls, (100, 0, 0)), (start | goal, (0, 0, 100))])
+            time.sleep(0.3)
+            printTest(
+                "LedBitboard",
+                hasPath(start, goal, free)
+                and not hasPath(start, goal, free & ~cellBit(0, 1) & ~cellBit(1, 0))
+                and tuple(matrix.frame[1, 1]) == (100, 0, 0),
+                f"{pathLength(start, goal, free)} steps",
+            )
+        except Exception as e:
+            printTest("LedBitboard", False, str(e))
+
+        # Test LedCompositor
+        try:
+            from JoyPiNoteBetterLib import LedCompositor
+
+            layers = LedCompositor(matrix, layerCount=2)
+            layers.fillLayer(0, (0, 0, 255, 255))
+            layers.setPixel(1, 0, (255, 0, 0, 255))
+            layers.update()
+            time.sleep(0.3)
+            printTest(
+                "LedCompositor",
+                tuple(matrix.frame[0, 0]) == (255, 0, 0)
+                and tuple(matrix.frame[0, 1]) == (0, 0, 255),
+            )
+        except Exception as e:
+            printTest("LedCompositor", False, str(e))
+
         # Clean up
         matrix.clear()
 
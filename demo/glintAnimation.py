@@ -5,6 +5,7 @@ import time
 from typing import Tuple
 
 from JoyPiNoteBetterLib import (
+    GlintEffect,
     LedMatrix,
     TouchSensor,
 )
@@ -27,12 +28,8 @@ def randomColor(minBrightness: int = 0) -> RgbColor:
 
 
 colorMinBrightness = 120
-matrixSize = (8, 8)
-cellBrightness: list[list[int]] = [
-    [random.randint(-255, 255) for _ in range(matrixSize[0])]
-    for _ in range(matrixSize[1])
-]
 color: RgbColor = randomColor(colorMinBrightness)
+glint = GlintEffect(color)
 globalBrightness: int = 255
 
 updateThread: threading.Thread | None = None
@@ -47,32 +44,12 @@ def startAnimation() -> None:
         return
 
     def runAnimation() -> None:
-        global color, cellBrightness, threadEvent
+        global threadEvent
 
         while not threadEvent.is_set():
-            for y in range(matrixSize[1]):
-                for x in range(matrixSize[0]):
-                    brightness = cellBrightness[y][x] - 1
-                    if brightness <= -255:
-                        brightness = 255
-
-                    if brightness == 0 and random.random() < 0.75:
-                        brightness = 5
-
-                    cellBrightness[y][x] = brightness
-
-                    b = abs(brightness) * abs(globalBrightness) // 255
-
-                    pixelColor = (0, 0, 0)
-                    if b != 0:
-                        pixelColor = (
-                            color[0] * b // 255,
-                            color[1] * b // 255,
-                            color[2] * b // 255,
-                        )
-                    led.setPixel(x + (y * 8), pixelColor)
-
-            led.update()
+            glint.color = color
+            glint.level = abs(globalBrightness) / 255
+            led.showFrame(glint.step())
             time.sleep(0.01)
 
     def runControl() -> None:
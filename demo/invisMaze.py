@@ -14,6 +14,15 @@ from JoyPiNoteBetterLib import (
     TouchSensor,
     Vibrator,
 )
+from JoyPiNoteBetterLib.Modules.LedBitboard import (
+    NEIGHBOR_MASKS,
+    cellBit,
+    cellsOf,
+    countCells,
+    hasPath,
+    squares,
+)
+from JoyPiNoteBetterLib.Modules.LedMatrix import FULL_MASK, shiftMask
 
 led = LedMatrix(30)
 led.clear()
@@ -50,79 +59,26 @@ finishBrightness = 255
 def generateMaze(
     start: tuple[int, int], end: tuple[int, int]
 ) -> list[list[None | int]]:
-    gen: list[list[None | int]] = [
-        [None for _ in range(MAZE_WIDTH)] for _ in range(MAZE_HEIGHT)
-    ]
+    # Walls as 64-bit bitboard, bit (y << 3) + x = cell x, y
+    startBit = cellBit(*start)
+    endBit = cellBit(*end)
+    walls = 0
 
     def isSolvable() -> bool:
-        visited = set()
-        stack = [start]
-        while stack:
-            current = stack.pop()
-            if current == end:
-                return True
-            if current in visited:
-                continue
-            visited.add(current)
-            cx, cy = current
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nx, ny = cx + dx, cy + dy
-                if 0 <= nx < MAZE_WIDTH and 0 <= ny < MAZE_HEIGHT:
-                    if gen[ny][nx] is None and (nx, ny) not in visited:
-                        stack.append((nx, ny))
+        return hasPath(startBit, endBit, FULL_MASK ^ walls)
+
+    def tryWall(cell: int) -> bool:
+        nonlocal walls
+        walls |= cell
+        if isSolvable():
+            return True
+        walls ^= cell
         return False
 
-    def count_paths() -> int:
-        """Count distinct paths from start to end"""
-        from collections import deque
-
-        queue = deque([(start, [start])])
-        visited_states = {start: 1}
-        paths_found = 0
-        min_length = float("inf")
-
-        while queue:
-            current, path = queue.popleft()
-
-            if len(path) > min_length + 3:
-                continue
-
-            if current == end:
-                if len(path) <= min_length + 3:
-                    paths_found += 1
-                    min_length = min(min_length, len(path))
-                continue
-
-            cx, cy = current
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nx, ny = cx + dx, cy + dy
-                if 0 <= nx < MAZE_WIDTH and 0 <= ny < MAZE_HEIGHT:
-                    if gen[ny][nx] is None and (nx, ny) not in path:
-                        new_path = path + [(nx, ny)]
-                        if (nx, ny) not in visited_states or visited_states[
-                            (nx, ny)
-                        ] < 3:
-                            visited_states[(nx, ny)] = (
-                                visited_states.get((nx, ny), 0) + 1
-                            )
-                            queue.append(((nx, ny), new_path))
-
-        return min(paths_found, 5)
-
-    def count_adjacent_walls(x: int, y: int) -> int:
-        count = 0
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < MAZE_WIDTH and 0 <= ny < MAZE_HEIGHT:
-                if gen[ny][nx] == 0:
-                    count += 1
-        return count
-
     all_positions = [
-        (x, y)
-        for y in range(MAZE_HEIGHT)
-        for x in range(MAZE_WIDTH)
-        if (x, y) != start and (x, y) != end
+        1 << i
+        for i in range(MAZE_WIDTH * MAZE_HEIGHT)
+        if not (1 << i) & (startBit | endBit)
     ]
 
     target_walls = random.randint(22, 28)
@@ -131,130 +87,87 @@ def generateMaze(
     # Komplett zufällige Wandplatzierung - keine Struktur-Regeln
     random.shuffle(all_positions)
 
-    for x, y in all_positions:
+    for cell in all_positions:
         if walls_placed >= target_walls:
             break
-
-        gen[y][x] = 0
-
-        if not isSolvable():
-            gen[y][x] = None
-        else:
+        if tryWall(cell):
             walls_placed += 1
 
     # Phase 2: Sackgassen erzeugen - Wände die fast einschließen
-    def count_free_neighbors(x: int, y: int) -> int:
-        count = 0
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < MAZE_WIDTH and 0 <= ny < MAZE_HEIGHT:
-                if gen[ny][nx] is None:
-                    count += 1
-            else:
-                count += 1  # Rand zählt als "frei" für Sackgassen
-        return count
+    def count_free_neighbors(cell: int) -> int:
+        around = NEIGHBOR_MASKS[cell.bit_length() - 1]
+        # Rand zählt als "frei" für Sackgassen
+        return 4 - countCells(around & walls)
 
     # Finde Positionen für Sackgassen (Stellen mit nur 1 freien Nachbarn)
-    empty_positions = [(x, y) for x, y in all_positions if gen[y][x] is None]
+    empty_positions = [cell for cell in all_positions if not cell & walls]
     random.shuffle(empty_positions)
 
     dead_ends_added = 0
-    for x, y in empty_positions:
+    for cell in empty_positions:
         if dead_ends_added >= random.randint(6, 12):
             break
         # Platziere Wand wenn es eine Sackgasse erzeugt
-        if count_free_neighbors(x, y) == 2:  # Würde einen Engpass/Sackgasse erzeugen
-            gen[y][x] = 0
-            if not isSolvable():
-                gen[y][x] = None
-            else:
-                dead_ends_added += 1
+        if count_free_neighbors(cell) == 2 and tryWall(cell):
+            dead_ends_added += 1
 
     # Phase 3: Zufällige Löcher in Wand-Clustern öffnen (verwirrt den Spieler)
-    wall_positions = [(x, y) for x, y in all_positions if gen[y][x] == 0]
+    wall_positions = [cell for cell in all_positions if cell & walls]
     random.shuffle(wall_positions)
 
     holes_opened = 0
-    for x, y in wall_positions:
+    for cell in wall_positions:
         if holes_opened >= random.randint(12, 18):
             break
         # Öffne Loch nur wenn es von mindestens 2 Wänden umgeben ist
-        wall_neighbors = 0
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < MAZE_WIDTH and 0 <= ny < MAZE_HEIGHT:
-                if gen[ny][nx] == 0:
-                    wall_neighbors += 1
-        if wall_neighbors >= 2:
-            gen[y][x] = None
+        if countCells(NEIGHBOR_MASKS[cell.bit_length() - 1] & walls) >= 2:
+            walls ^= cell
             holes_opened += 1
 
     # Phase 3.5: Lange gerade Pfade unterbrechen
-    def find_straight_path_length(x: int, y: int, dx: int, dy: int) -> int:
+    def straight_path_length(cell: int, dx: int, dy: int) -> int:
         """Zählt wie viele freie Felder in einer Richtung"""
         length = 0
-        cx, cy = x, y
+        free = FULL_MASK ^ walls
         while True:
-            cx, cy = cx + dx, cy + dy
-            if not (0 <= cx < MAZE_WIDTH and 0 <= cy < MAZE_HEIGHT):
-                break
-            if gen[cy][cx] is not None:
-                break
+            cell = shiftMask(cell, dx, dy)
+            if not cell & free:
+                return length
             length += 1
-        return length
 
-    empty_positions = [(x, y) for x, y in all_positions if gen[y][x] is None]
+    empty_positions = [cell for cell in all_positions if not cell & walls]
     random.shuffle(empty_positions)
 
     blockers_added = 0
-    for x, y in empty_positions:
+    for cell in empty_positions:
         if blockers_added >= random.randint(3, 6):
             break
         # Prüfe ob Teil eines langen geraden Pfads (3+ in eine Richtung)
-        h_length = find_straight_path_length(x, y, -1, 0) + find_straight_path_length(
-            x, y, 1, 0
-        )
-        v_length = find_straight_path_length(x, y, 0, -1) + find_straight_path_length(
-            x, y, 0, 1
-        )
+        h_length = straight_path_length(cell, -1, 0) + straight_path_length(cell, 1, 0)
+        v_length = straight_path_length(cell, 0, -1) + straight_path_length(cell, 0, 1)
 
-        if h_length >= 3 or v_length >= 3:
-            gen[y][x] = 0
-            if not isSolvable():
-                gen[y][x] = None
-            else:
-                blockers_added += 1
+        if (h_length >= 3 or v_length >= 3) and tryWall(cell):
+            blockers_added += 1
 
     # Phase 4: Fülle große freie Flächen
-    def has_large_empty_area(x: int, y: int) -> bool:
-        """Prüft ob um (x,y) herum eine 2x2 oder größere freie Fläche ist"""
-        for dy in range(-1, 1):
-            for dx in range(-1, 1):
-                all_empty = True
-                for cy in range(2):
-                    for cx in range(2):
-                        nx, ny = x + dx + cx, y + dy + cy
-                        if not (0 <= nx < MAZE_WIDTH and 0 <= ny < MAZE_HEIGHT):
-                            all_empty = False
-                            break
-                        if gen[ny][nx] is not None:
-                            all_empty = False
-                            break
-                    if not all_empty:
-                        break
-                if all_empty:
-                    return True
-        return False
+    def in_large_empty_area(cell: int) -> bool:
+        """Prüft ob (x,y) in einer freien 2x2 Fläche liegt"""
+        corners = squares(FULL_MASK ^ walls)
+        area = corners | (corners << 1) | (corners << 8) | (corners << 9)
+        return bool(cell & area)
 
-    empty_positions = [(x, y) for x, y in all_positions if gen[y][x] is None]
+    empty_positions = [cell for cell in all_positions if not cell & walls]
     random.shuffle(empty_positions)
 
-    for x, y in empty_positions:
-        if has_large_empty_area(x, y):
-            gen[y][x] = 0
-            if not isSolvable():
-                gen[y][x] = None
+    for cell in empty_positions:
+        if in_large_empty_area(cell):
+            tryWall(cell)
 
+    gen: list[list[None | int]] = [
+        [None for _ in range(MAZE_WIDTH)] for _ in range(MAZE_HEIGHT)
+    ]
+    for x, y in cellsOf(walls):
+        gen[y][x] = 0
     return gen
 
 
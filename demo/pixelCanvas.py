@@ -18,6 +18,7 @@ from JoyPiNoteBetterLib import (
 RgbaColor = Tuple[int, int, int, int]
 
 led = LedMatrix(30)
+led.setMaxFps(30)  # update, control and brightness loops share one push per frame
 seg = Seg7x4()
 lcd = LcdDisplay()
 scrLines = ScrollingLinesLcd(lcd)
@@ -298,6 +299,7 @@ def exitHandler() -> None:
     if brightnessThread is not None:
         brightnessThread.join(0.1)
 
+    led.setMaxFps(None)  # push directly again, so the clear is not lost on exit
     led.clear()
     lcd.clear()
     lcd.setBacklight(False)